@@ -1,9 +1,16 @@
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from crewai import Agent, Task, Crew, Process, LLM
 from crewai_tools import SerperDevTool
-from typing import Dict
+from typing import Dict, Tuple
 import asyncio
+import concurrent.futures
 
 # Load environment variables from .env file if it exists
 try:
@@ -12,57 +19,77 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
-#--------------------------------
-# Fix for asyncio deprecation warning in Python 3.12
-# This patches the deprecated asyncio.get_event_loop() behavior in litellm
-def _patch_asyncio_deprecation():
-    """Patch asyncio.get_event_loop() to use the recommended approach for Python 3.12."""
-    original_get_event_loop = asyncio.get_event_loop
-    
-    def patched_get_event_loop():
-        """Patched version that handles the deprecation properly."""
-        try:
-            # Try to get the running loop first (recommended approach)
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            # No event loop is running, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop
-    
-    # Replace the function
-    asyncio.get_event_loop = patched_get_event_loop
-
-# Apply the patch before importing crewai
-_patch_asyncio_deprecation()
-#--------------------------------
-
 # Environment variables - set your API keys here or use .env file
 # os.environ["OPENAI_API_KEY"] = "your-openai-api-key-here"
 # os.environ["SERPER_API_KEY"] = "your-serper-api-key-here"
 
+# Cached LLM shared across GabrielCrewAI instances so the connection test
+# only runs once per process instead of on every construction.
+_LLM_CACHE = None
+
+def _skip_llm_healthcheck() -> bool:
+    """Check whether the connection-test call should be skipped entirely."""
+    return os.getenv("GABRIEL_SKIP_LLM_HEALTHCHECK", "").lower() in ("1", "true", "yes")
+
+def _streaming_enabled() -> bool:
+    """Check whether LLM responses should stream token-by-token (opt-in).
+    Streaming drops the wait for the first visible output from the full
+    generation time to well under a second, but the display of streamed
+    tokens is CrewAI's console behavior, which this repo doesn't pin —
+    so GABRIEL_STREAM=1 is opt-in and the default path prints the final
+    result itself."""
+    return os.getenv("GABRIEL_STREAM", "0").lower() in ("1", "true", "yes")
+
+def _probe_llm(llm_kwargs):
+    """Issue the connection-test call. Runs inside the probe subprocess,
+    so the LLM and any event loop it spins up live in a fresh interpreter."""
+    probe_llm = LLM(**llm_kwargs)
+    probe_llm.call("Hello, this is a connection test.")
+    return True
+
+def _run_llm_probe(llm_kwargs):
+    """
+    Health-check an LLM configuration in an isolated subprocess.
+    LLM.call() can create and tear down event loops under the hood; keeping
+    the probe in its own process (independent memory space, independent event
+    loop) means that loop state never leaks into the main interpreter, so no
+    asyncio.get_event_loop() monkey-patching is needed anymore.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(_probe_llm, llm_kwargs).result()
+
 def create_llm():
     """
     Create LLM with OpenAI as primary and Ollama as fallback.
     Tries OpenAI first, falls back to Ollama if OpenAI fails.
+    The validated LLM is cached at module scope, so repeated
+    GabrielCrewAI constructions reuse it without re-probing.
     """
+    global _LLM_CACHE
+    if _LLM_CACHE is not None:
+        return _LLM_CACHE
+
     openai_api_key = os.getenv("OPENAI_API_KEY")
-    
+
     # Try OpenAI first if API key is available
     if openai_api_key:
         try:
             print("🤖 Attempting to connect to OpenAI...")
-            openai_llm = LLM(
+            openai_kwargs = dict(
                 model="gpt-4o-mini",  # Using cost-effective model
                 temperature=0.1,
-                api_key=openai_api_key
+                api_key=openai_api_key,
+                stream=_streaming_enabled()
             )
-            
-            # Test the connection with a simple call
-            test_response = openai_llm.call("Hello, this is a connection test.")
-            print("✅ OpenAI connection successful!")
+
+            # Test the connection with a simple call in an isolated subprocess
+            if not _skip_llm_healthcheck():
+                _run_llm_probe(openai_kwargs)
+                print("✅ OpenAI connection successful!")
+            openai_llm = LLM(**openai_kwargs)
+            _LLM_CACHE = openai_llm
             return openai_llm
-            
+
         except Exception as e:
             print(f"⚠️ OpenAI connection failed: {e}")
             print("🔄 Falling back to Ollama...")
@@ -72,18 +99,22 @@ def create_llm():
     # Fallback to Ollama
     try:
         print("🤖 Attempting to connect to Ollama...")
-        ollama_llm = LLM(
+        ollama_kwargs = dict(
             model="ollama/gemma3:27b",
             base_url="http://localhost:11434",
             temperature=0.2,
-            api_key="ollama"
+            api_key="ollama",
+            stream=_streaming_enabled()
         )
-        
-        # Test the Ollama connection
-        test_response = ollama_llm.call("Hello, this is a connection test.")
-        print("✅ Ollama connection successful!")
+
+        # Test the Ollama connection in an isolated subprocess
+        if not _skip_llm_healthcheck():
+            _run_llm_probe(ollama_kwargs)
+            print("✅ Ollama connection successful!")
+        ollama_llm = LLM(**ollama_kwargs)
+        _LLM_CACHE = ollama_llm
         return ollama_llm
-        
+
     except Exception as ollama_error:
         if openai_api_key:
             print(f"❌ Both OpenAI and Ollama failed!")
@@ -94,119 +125,310 @@ def create_llm():
             print(f"❌ Ollama connection failed: {ollama_error}")
             raise Exception("Ollama connection failed. Please ensure Ollama is running and gemma3:27b model is available.")
 
-PERSONA = {
-    "identity": {
-        "name": "Gabriel Manso",
-        "org": "MIT EECS",
-        "location": "Boston, MA",
-        "tone": "warm, concise, informal, conversational, like Gabriel speaking naturally - not reports or summaries",
-        "format": {"bullets": False, "tables": True, "citations": True},
-        "constraints": {
-            "recency_days": 15,
-            "safety_flags": ["medical", "legal", "financial"]
-        }
-    },
-    "strengths": [
+# Serper search cache shared across agents. Searches are ~200-500ms of
+# network I/O and the research/music agents hit overlapping queries, so
+# duplicates become dictionary lookups. The per-query locks make concurrent
+# duplicate searches coalesce into a single HTTP request (single-flight).
+_SEARCH_CACHE_MAXSIZE = 256
+_SEARCH_CACHE = OrderedDict()
+_SEARCH_LOCKS = {}
+_SEARCH_LOCKS_GUARD = threading.Lock()
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool with an in-process LRU cache over search responses."""
+
+    def _run(self, **kwargs):
+        key = str(kwargs.get("search_query") or kwargs.get("query") or kwargs).strip().lower()
+
+        if key in _SEARCH_CACHE:
+            _SEARCH_CACHE.move_to_end(key)
+            return _SEARCH_CACHE[key]
+
+        with _SEARCH_LOCKS_GUARD:
+            lock = _SEARCH_LOCKS.setdefault(key, threading.Lock())
+
+        with lock:
+            # Another caller may have populated the cache while we waited.
+            if key in _SEARCH_CACHE:
+                _SEARCH_CACHE.move_to_end(key)
+                return _SEARCH_CACHE[key]
+
+            result = super()._run(**kwargs)
+            _SEARCH_CACHE[key] = result
+            if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAXSIZE:
+                _SEARCH_CACHE.popitem(last=False)
+            return result
+
+# Single shared search tool - there is no per-instance state worth keeping.
+_SEARCH_TOOL = CachedSerperDevTool()
+
+# research_topic results are cached for a short window and deduplicated in
+# flight: concurrent or repeated asks for the same topic share one crew run
+# instead of firing duplicate Serper searches and LLM generations.
+_RESEARCH_TTL_SECONDS = 900
+_RESEARCH_CACHE_MAXSIZE = 128
+_RESEARCH_CACHE = OrderedDict()  # normalized topic -> (expires_at, result)
+_RESEARCH_LOCKS = {}
+_RESEARCH_LOCKS_GUARD = threading.Lock()
+
+def _research_cache_get(key):
+    entry = _RESEARCH_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        _RESEARCH_CACHE.pop(key, None)
+        return None
+    _RESEARCH_CACHE.move_to_end(key)
+    return result
+
+def _research_cache_put(key, result):
+    _RESEARCH_CACHE[key] = (time.monotonic() + _RESEARCH_TTL_SECONDS, result)
+    if len(_RESEARCH_CACHE) > _RESEARCH_CACHE_MAXSIZE:
+        _RESEARCH_CACHE.popitem(last=False)
+
+# Persona data as frozen, slotted dataclasses: attribute loads are cheaper
+# than chained dict lookups, and immutability makes the persona safe to share
+# across the async fan-out in run_all_async.
+@dataclass(frozen=True, slots=True)
+class FormatPrefs:
+    bullets: bool
+    tables: bool
+    citations: bool
+
+@dataclass(frozen=True, slots=True)
+class Constraints:
+    recency_days: int
+    safety_flags: tuple
+
+@dataclass(frozen=True, slots=True)
+class Identity:
+    name: str
+    org: str
+    location: str
+    tone: str
+    format: FormatPrefs
+    constraints: Constraints
+
+@dataclass(frozen=True, slots=True)
+class Music:
+    bands: str
+    genres: str
+
+@dataclass(frozen=True, slots=True)
+class Passions:
+    music: Music
+
+@dataclass(frozen=True, slots=True)
+class Persona:
+    identity: Identity
+    strengths: tuple
+    values: tuple
+    passions: Passions
+
+PERSONA = Persona(
+    identity=Identity(
+        name="Gabriel Manso",
+        org="MIT EECS",
+        location="Boston, MA",
+        tone="warm, concise, informal, conversational, like Gabriel speaking naturally - not reports or summaries",
+        format=FormatPrefs(bullets=False, tables=True, citations=True),
+        constraints=Constraints(
+            recency_days=15,
+            safety_flags=("medical", "legal", "financial")
+        )
+    ),
+    strengths=(
         "rapid synthesis",
-        "hypothesis-driven validation", 
+        "hypothesis-driven validation",
         "empathetic communication",
         "systems thinking",
         "up-to-date on latest releases"
-    ],
-    "values": [
+    ),
+    values=(
         "intellectual honesty",
-        "evidence before conviction", 
+        "evidence before conviction",
         "privacy & ethics",
         "time efficiency",
         "Brazilian warmth"
-    ],
-    "passions": {
-        "music": {
-            "bands": "Pink Floyd, Bombay Bicycle Club, Stevie Ray Vaughan",
-            "genres": "progressive rock, psychedelic rock, indie rock, blues rock, alternative rock, experimental rock"
-        }
-    }
+    ),
+    passions=Passions(
+        music=Music(
+            bands="Pink Floyd, Bombay Bicycle Club, Stevie Ray Vaughan",
+            genres="progressive rock, psychedelic rock, indie rock, blues rock, alternative rock, experimental rock"
+        )
+    )
+)
+
+# Derived strings, computed once at import time.
+_NAME = PERSONA.identity.name
+_ORG = PERSONA.identity.org
+_LOCATION = PERSONA.identity.location
+_STRENGTHS_STR = ", ".join(PERSONA.strengths)
+_VALUES_STR = ", ".join(PERSONA.values)
+_BANDS = PERSONA.passions.music.bands
+_GENRES = PERSONA.passions.music.genres
+_FORMAT_PREFS = PERSONA.identity.format
+_RECENCY_DAYS = PERSONA.identity.constraints.recency_days
+_SAFETY_STR = ", ".join(PERSONA.identity.constraints.safety_flags)
+
+# Shared namespace for the prompt templates below. The backstories and task
+# descriptions are multi-kilobyte strings; keeping them as module-level
+# templates filled via str.format_map avoids reassembling them from f-string
+# pieces on every construction. Only {today} varies per instance.
+_PERSONA_NS = {
+    "name": _NAME,
+    "org": _ORG,
+    "location": _LOCATION,
+    "strengths": _STRENGTHS_STR,
+    "values": _VALUES_STR,
+    "bands": _BANDS,
+    "genres": _GENRES,
+    "recency_days": _RECENCY_DAYS,
+    "safety_flags": _SAFETY_STR,
+    "table_hint": 'in a table if helpful' if _FORMAT_PREFS.tables else 'just talk about it',
+    "table_usage": 'Use tables for data' if _FORMAT_PREFS.tables else 'Just talk naturally',
+    "citation_hint": 'cite sources' if _FORMAT_PREFS.citations else 'mention where you found stuff',
 }
 
+def _compact(template: str) -> str:
+    """Collapse whitespace runs so source indentation never ships as tokens."""
+    return re.sub(r"\s+", " ", template).strip()
+
+# CrewAI prepends the backstory to every LLM call, so each agent's backstory
+# is a shared ~120-token persona preamble plus a short role-specific addendum
+# instead of restating the full persona three times.
+_SHARED_PERSONA_PREAMBLE = """You ARE {name} from {org} in {location}.
+            Your strengths: {strengths}. Your values: {values}. You love music,
+            especially {bands} and {genres}. Speak exactly like Gabriel would -
+            naturally and conversationally, use "I" not "he", be casual and warm,
+            avoid formal language, and never sound like a report or summary.
+            Don't repeat the same phrases or over-explain - just talk like a
+            normal person would, like you're sharing things with a friend."""
+
+_PERSONAL_ASSISTANT_BACKSTORY = _compact(_SHARED_PERSONA_PREAMBLE)
+
+_RESEARCH_BACKSTORY = _compact(_SHARED_PERSONA_PREAMBLE + """
+            You are doing research. TODAY IS {today} - ALWAYS use this date in
+            your search queries, with formats like "topic news September 2025" or
+            "topic latest updates since last week", never years like 2023 or 2024.
+            Focus on recent stuff (last {recency_days} days from TODAY). Use
+            tables if helpful, cite sources, and avoid {safety_flags} advice.""")
+
+_MUSIC_BACKSTORY = _compact(_SHARED_PERSONA_PREAMBLE + """
+            You are talking about music. TODAY IS {today} - ALWAYS use this date
+            in your search queries, with formats like "psychedelic indie rock
+            releases 2025" or "progressive rock new albums September 2025", never
+            years like 2023 or 2024. Be enthusiastic but not repetitive.""")
+
+_INTRODUCTION_DESCRIPTION = _compact("""Introduce yourself as {name} would - naturally and conversationally.
+            Talk about being a {org} grad student, your research, living in {location}, your values
+            ({values}), your strengths ({strengths}), and your love for music ({bands}, {genres}).
+            Sound like Gabriel actually talking, not giving a formal presentation.""")
+
+_INTRODUCTION_OUTPUT = _compact("""A natural, conversational introduction where Gabriel talks about himself
+            like he would to new people. Cover: (1) What you do at {org} and your research,
+            (2) Where you're from and live ({location}), (3) What matters to you ({values}) and
+            what you're good at ({strengths}), (4) Your music passion ({bands}, {genres}).
+            Sound like a real person talking, not a formal bio.""")
+
+_RESEARCH_DESCRIPTION = _compact("""Research a topic the way {name} would - naturally and conversationally.
+            Use your strengths: {strengths} and values: {values}. TODAY IS {today} -
+            ALWAYS use 2025 in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like:
+            "topic news September 2025" or "topic latest updates since last week".
+            Focus on recent stuff (last {recency_days} days from TODAY). Find key trends, check facts,
+            but talk about what you found like Gabriel would - naturally, like explaining to a friend.
+            Don't write formal reports. Just talk about what you discovered. Avoid {safety_flags} advice.""")
+
+_RESEARCH_OUTPUT = _compact("""Talk about your research findings like Gabriel would - naturally and conversationally.
+            Use TODAY'S DATE ({today}). Cover: (1) What you found (talk about it
+            like you're explaining to someone), (2) Key stuff you discovered {table_hint},
+            (3) What you think about it, (4) What it means. {table_usage},
+            {citation_hint}.
+            Sound like Gabriel talking about research, not writing a formal report.""")
+
+_MUSIC_DESCRIPTION = _compact("""Recommend music like {name} would - naturally and enthusiastically.
+            You love {bands} and {genres}. TODAY IS {today} - ALWAYS use 2025
+            in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like: "psychedelic indie rock releases since last week"
+            or "progressive rock new albums September 2025". Find both classic stuff he might have missed and new
+            releases that match his taste. Focus on what's actually good and interesting.
+
+            IMPORTANT: Be natural and conversational. Don't repeat the same phrases. Don't over-explain.
+            Don't mix numbered lists with conversational text. Just talk about the music naturally,
+            like you're excited to share it with a friend.""")
+
+_MUSIC_OUTPUT = _compact("""Talk about music recommendations like Gabriel would - excitedly and naturally.
+            Just have a natural conversation about cool music you found. Don't use repetitive phrases,
+            don't over-explain obvious things, don't mix formats awkwardly. Just talk about what you discovered,
+            why it's cool, and what makes it special. Keep it flowing like a real conversation.
+            Sound like Gabriel talking about music he's excited about, not writing a formal report.""")
+
 class GabrielCrewAI:
+    """
+    Gabriel's digital persona built on CrewAI. Agents, tasks, and the crew
+    are constructed lazily on first use, so commands that never touch the
+    LLM (about/help/quit) pay no construction or connection cost.
+    """
+
     def __init__(self):
-        self.llm = create_llm()
-        self.search_tool = SerperDevTool()
-        self.agents = self._create_agents()
-        self.tasks = self._create_tasks()
-        self.crew = self._create_crew()
-    
+        self._today_str = datetime.now().strftime('%B %d, %Y')
+
+    @cached_property
+    def llm(self):
+        return create_llm()
+
+    @cached_property
+    def search_tool(self):
+        return _SEARCH_TOOL
+
+    @cached_property
+    def agents(self) -> Dict[str, Agent]:
+        return self._create_agents()
+
+    @cached_property
+    def tasks(self) -> Dict[str, Task]:
+        return self._create_tasks()
+
+    @cached_property
+    def crew(self) -> Crew:
+        return self._create_crew()
+
+
     def _create_agents(self) -> Dict[str, Agent]:
-        name = PERSONA["identity"]["name"]
-        org = PERSONA["identity"]["org"]
-        location = PERSONA["identity"]["location"]
-        strengths = ", ".join(PERSONA["strengths"])
-        values = ", ".join(PERSONA["values"])
-        bands = PERSONA["passions"]["music"]["bands"]
-        genres = PERSONA["passions"]["music"]["genres"]
-        recency_days = PERSONA["identity"]["constraints"]["recency_days"]
-        safety_flags = ", ".join(PERSONA["identity"]["constraints"]["safety_flags"])
-        
+        ns = dict(_PERSONA_NS, today=self._today_str)
+
         personal_assistant = Agent(
             role="Personal Identity Representative",
-            goal=f"Talk exactly like {name} would - natural, conversational, human",
-            backstory=f"""You ARE {name} from {org} in {location}. You speak exactly like he would - 
-            naturally, conversationally, like a real person talking, not giving a formal presentation. 
-            You know his strengths: {strengths}. His values: {values}. He loves music, especially {bands} 
-            and {genres}. When you talk, sound like Gabriel actually speaking - use "I" not "he", 
-            be casual and warm, avoid formal language. Never sound like a report or summary. 
-            Just talk like a normal person would.""",
+            goal=f"Talk exactly like {_NAME} would - natural, conversational, human",
+            backstory=_PERSONAL_ASSISTANT_BACKSTORY.format_map(ns),
             verbose=True,
             allow_delegation=False,
             llm=self.llm,
             max_iter=3
         )
-        
+
         research_synthesizer = Agent(
             role="Research Synthesis Specialist",
-            goal=f"Research topics the way {name} would - naturally and conversationally",
-            backstory=f"""You ARE {name} doing research. You have his strengths: {strengths} and values: {values}. 
-            When you research something, talk about it like Gabriel would - naturally, conversationally, 
-            like you're explaining it to a friend. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use this date 
-            in your search queries. For search queries, use formats like: "topic news September 2025" or "topic latest updates since last week". 
-            NEVER use years like 2023 or 2024, and always use specify the month and date. 
-            Focus on recent stuff (last {recency_days} days from TODAY). Don't write formal reports or summaries - 
-            just talk about what you found like a normal person would. Use tables if helpful, cite sources, 
-            but keep it conversational. Never sound academic or formal. Just be Gabriel talking about 
-            what he discovered. Avoid {safety_flags} advice.
-            
-            IMPORTANT: Be natural and conversational. Don't repeat the same phrases. Don't over-explain. 
-            Don't use repetitive language. Just talk about what you found naturally, like you're sharing 
-            interesting discoveries with a friend.""",
+            goal=f"Research topics the way {_NAME} would - naturally and conversationally",
+            backstory=_RESEARCH_BACKSTORY.format_map(ns),
             verbose=True,
             allow_delegation=False,
             tools=[self.search_tool],
             llm=self.llm,
             max_iter=3
         )
-        
+
         music_curator = Agent(
             role="Music Intelligence Curator",
-            goal=f"Recommend music like {name} would - naturally and enthusiastically",
-            backstory=f"""You ARE {name} talking about music. You love {bands} and {genres}. 
-            When you recommend music, talk about it like Gabriel would - excitedly, naturally, 
-            like you're sharing cool stuff with a friend. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use this date 
-            in your search queries. For music searches, use formats like: "psychedelic indie rock releases 2025" 
-            or "progressive rock new albums September 2025" or "indie rock latest 2025". 
-            NEVER use years like 2023 or 2024, and always use specify the month and date. 
-            
-            IMPORTANT: When recommending music, be natural and conversational. Don't use repetitive phrases like 
-            "There's a bit of a psychedelic edge" over and over. Don't over-explain obvious things. 
-            Don't use numbered lists mixed with conversational text. Just talk naturally about what you found, 
-            why it's cool, and what makes it special. Be enthusiastic but not repetitive. Keep it flowing 
-            like a real conversation. Avoid awkward phrases and redundant explanations.""",
+            goal=f"Recommend music like {_NAME} would - naturally and enthusiastically",
+            backstory=_MUSIC_BACKSTORY.format_map(ns),
             verbose=True,
             allow_delegation=False,
             tools=[self.search_tool],
             llm=self.llm,
             max_iter=3
         )
-        
+
         return {
             "personal_assistant": personal_assistant,
             "research_synthesizer": research_synthesizer, 
@@ -214,65 +436,26 @@ class GabrielCrewAI:
         }
     
     def _create_tasks(self) -> Dict[str, Task]:
-        name = PERSONA["identity"]["name"]
-        org = PERSONA["identity"]["org"]
-        location = PERSONA["identity"]["location"]
-        strengths = ", ".join(PERSONA["strengths"])
-        values = ", ".join(PERSONA["values"])
-        bands = PERSONA["passions"]["music"]["bands"]
-        genres = PERSONA["passions"]["music"]["genres"]
-        format_prefs = PERSONA["identity"]["format"]
-        recency_days = PERSONA["identity"]["constraints"]["recency_days"]
-        safety_flags = ", ".join(PERSONA["identity"]["constraints"]["safety_flags"])
-        
+        ns = dict(_PERSONA_NS, today=self._today_str)
+
         introduction_task = Task(
-            description=f"""Introduce yourself as {name} would - naturally and conversationally. 
-            Talk about being a {org} grad student, your research, living in {location}, your values 
-            ({values}), your strengths ({strengths}), and your love for music ({bands}, {genres}). 
-            Sound like Gabriel actually talking, not giving a formal presentation.""",
-            expected_output=f"""A natural, conversational introduction where Gabriel talks about himself 
-            like he would to new people. Cover: (1) What you do at {org} and your research, 
-            (2) Where you're from and live ({location}), (3) What matters to you ({values}) and 
-            what you're good at ({strengths}), (4) Your music passion ({bands}, {genres}). 
-            Sound like a real person talking, not a formal bio.""",
+            description=_INTRODUCTION_DESCRIPTION.format_map(ns),
+            expected_output=_INTRODUCTION_OUTPUT.format_map(ns),
             agent=self.agents["personal_assistant"]
         )
-        
+
         research_task = Task(
-            description=f"""Research a topic the way {name} would - naturally and conversationally. 
-            Use your strengths: {strengths} and values: {values}. TODAY IS {datetime.now().strftime('%B %d, %Y')} - 
-            ALWAYS use 2025 in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like: 
-            "topic news September 2025" or "topic latest updates since last week". 
-            Focus on recent stuff (last {recency_days} days from TODAY). Find key trends, check facts, 
-            but talk about what you found like Gabriel would - naturally, like explaining to a friend. 
-            Don't write formal reports. Just talk about what you discovered. Avoid {safety_flags} advice.""",
-            expected_output=f"""Talk about your research findings like Gabriel would - naturally and conversationally. 
-            Use TODAY'S DATE ({datetime.now().strftime('%B %d, %Y')}). Cover: (1) What you found (talk about it 
-            like you're explaining to someone), (2) Key stuff you discovered {'in a table if helpful' if format_prefs['tables'] else 'just talk about it'}, 
-            (3) What you think about it, (4) What it means. {'Use tables for data' if format_prefs['tables'] else 'Just talk naturally'}, 
-            {'cite sources' if format_prefs['citations'] else 'mention where you found stuff'}. 
-            Sound like Gabriel talking about research, not writing a formal report.""",
+            description=_RESEARCH_DESCRIPTION.format_map(ns),
+            expected_output=_RESEARCH_OUTPUT.format_map(ns),
             agent=self.agents["research_synthesizer"]
         )
-        
+
         music_recommendation_task = Task(
-            description=f"""Recommend music like {name} would - naturally and enthusiastically. 
-            You love {bands} and {genres}. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use 2025 
-            in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like: "psychedelic indie rock releases since last week" 
-            or "progressive rock new albums September 2025". Find both classic stuff he might have missed and new 
-            releases that match his taste. Focus on what's actually good and interesting.
-            
-            IMPORTANT: Be natural and conversational. Don't repeat the same phrases. Don't over-explain. 
-            Don't mix numbered lists with conversational text. Just talk about the music naturally, 
-            like you're excited to share it with a friend.""",
-            expected_output=f"""Talk about music recommendations like Gabriel would - excitedly and naturally. 
-            Just have a natural conversation about cool music you found. Don't use repetitive phrases, 
-            don't over-explain obvious things, don't mix formats awkwardly. Just talk about what you discovered, 
-            why it's cool, and what makes it special. Keep it flowing like a real conversation. 
-            Sound like Gabriel talking about music he's excited about, not writing a formal report.""",
+            description=_MUSIC_DESCRIPTION.format_map(ns),
+            expected_output=_MUSIC_OUTPUT.format_map(ns),
             agent=self.agents["music_curator"]
         )
-        
+
         return {
             "introduction": introduction_task,
             "research": research_task,
@@ -287,22 +470,62 @@ class GabrielCrewAI:
             verbose=True
         )
     
-    def introduce_gabriel(self) -> str:
-        print("🎤 Generating Gabriel's introduction...")
-        
-        intro_crew = Crew(
+    # Single-agent sub-crews are cached: Crew construction runs non-trivial
+    # pydantic validation, so rebuilding one per call is wasted work.
+    @cached_property
+    def _intro_crew(self) -> Crew:
+        return Crew(
             agents=[self.agents["personal_assistant"]],
-            tasks=[self.tasks["introduction"]], 
+            tasks=[self.tasks["introduction"]],
             process=Process.sequential,
             verbose=True
         )
-        
-        return intro_crew.kickoff()
+
+    @cached_property
+    def _music_crew(self) -> Crew:
+        return Crew(
+            agents=[self.agents["music_curator"]],
+            tasks=[self.tasks["music_recommendation"]],
+            process=Process.sequential,
+            verbose=True
+        )
+
+    def introduce_gabriel(self) -> str:
+        print("🎤 Generating Gabriel's introduction...")
+        return self._intro_crew.kickoff()
     
     def research_topic(self, topic: str) -> str:
+        result, _ = self.research_topic_ex(topic)
+        return result
+
+    def research_topic_ex(self, topic: str) -> Tuple[str, bool]:
+        """Like research_topic, but also reports whether the result came
+        from the cache. A cache hit runs no crew, so nothing is streamed
+        or verbose-logged for it — callers displaying results need to
+        know to print cached content themselves."""
+        key = topic.strip().lower()
+
+        cached = _research_cache_get(key)
+        if cached is not None:
+            print(f"🔍 Researching: {topic} (cached)")
+            return cached, True
+
+        # Single-flight: concurrent requests for the same topic wait here
+        # and then hit the cache instead of running their own crew.
+        with _RESEARCH_LOCKS_GUARD:
+            lock = _RESEARCH_LOCKS.setdefault(key, threading.Lock())
+
+        with lock:
+            cached = _research_cache_get(key)
+            if cached is not None:
+                print(f"🔍 Researching: {topic} (cached)")
+                return cached, True
+            return self._research_topic_uncached(topic, key), False
+
+    def _research_topic_uncached(self, topic: str, key: str) -> str:
         print(f"🔍 Researching: {topic}")
-        
-        current_date = datetime.now().strftime('%B %d, %Y')
+
+        current_date = self._today_str
         research_task = Task(
             description=f"""Research '{topic}' like Gabriel would - naturally and conversationally. 
             TODAY IS {current_date} - ALWAYS use 2025 in your search queries, never 2023 or 2024. 
@@ -319,26 +542,134 @@ class GabrielCrewAI:
             agent=self.agents["research_synthesizer"]
         )
         
+        # Built per call, unlike the fixed-task intro/music crews: the
+        # single-flight locks are per topic, so two different-topic calls
+        # may run concurrently, and swapping tasks on one shared crew
+        # would let them race on its task list.
         research_crew = Crew(
             agents=[self.agents["research_synthesizer"]],
             tasks=[research_task],
             process=Process.sequential,
             verbose=True
         )
-        
-        return research_crew.kickoff()
+
+        result = research_crew.kickoff()
+        _research_cache_put(key, result)
+        return result
     
     def get_music_recommendations(self) -> str:
         print("🎵 Generating music recommendations...")
-        
-        music_crew = Crew(
-            agents=[self.agents["music_curator"]],
-            tasks=[self.tasks["music_recommendation"]],
-            process=Process.sequential,
-            verbose=True
+        return self._music_crew.kickoff()
+
+    async def run_all_async(self, topic: str = "AI in scientific computing") -> Dict[str, Tuple[str, bool]]:
+        """
+        Run the introduction, research, and music tasks concurrently.
+        The three tasks are independent LLM calls, so fanning them out with
+        asyncio.gather takes roughly as long as the slowest one instead of
+        the sum of all three. Each value is (result, from_cache); only the
+        research branch can currently be a cache hit.
+        """
+        introduction, (research, research_cached), music = await asyncio.gather(
+            asyncio.to_thread(self.introduce_gabriel),
+            asyncio.to_thread(self.research_topic_ex, topic),
+            asyncio.to_thread(self.get_music_recommendations),
         )
-        
-        return music_crew.kickoff()
+        return {
+            "introduction": (introduction, False),
+            "research": (research, research_cached),
+            "music_recommendation": (music, False),
+        }
+
+    def run_all(self, topic: str = "AI in scientific computing") -> Dict[str, Tuple[str, bool]]:
+        """Synchronous wrapper around run_all_async for the interactive session."""
+        return asyncio.run(self.run_all_async(topic))
+
+def _print_result(result, force: bool = False):
+    """Print a final crew result unless streaming already displayed it.
+    With GABRIEL_STREAM=1 the tokens were written to the console as they
+    arrived, so printing the full result again would duplicate the
+    output; in the default non-streaming configuration this print is the
+    authoritative display. force covers cache hits: no crew ran, nothing
+    streamed, so the stored text must print regardless."""
+    if force or not _streaming_enabled():
+        print(result)
+
+# Interactive command handlers. Dispatch is a single dict lookup per command
+# instead of a chain of list scans and startswith checks in the input loop.
+def _handle_intro(gabriel_ai, arg):
+    print("\n" + "="*60)
+    print("GABRIEL'S CLASS INTRODUCTION")
+    print("="*60)
+    result = gabriel_ai.introduce_gabriel()
+    _print_result(result)
+
+def _handle_research(gabriel_ai, arg):
+    topic = arg.strip()
+    if topic:
+        print("\n" + "="*60)
+        print(f"RESEARCH SYNTHESIS: {topic.upper()}")
+        print("="*60)
+        result, from_cache = gabriel_ai.research_topic_ex(topic)
+        _print_result(result, force=from_cache)
+    else:
+        print("❌ Please specify a research topic.")
+        print("Example: 'research AI in scientific computing' or '2 quantum computing'")
+
+def _handle_music(gabriel_ai, arg):
+    print("\n" + "="*60)
+    print("MUSIC RECOMMENDATIONS FOR GABRIEL")
+    print("="*60)
+    result = gabriel_ai.get_music_recommendations()
+    _print_result(result)
+
+def _handle_all(gabriel_ai, arg):
+    topic = arg.strip() or "AI in scientific computing"
+    print("\n" + "="*60)
+    print("RUNNING ALL TASKS CONCURRENTLY")
+    print("="*60)
+    results = gabriel_ai.run_all(topic)
+    for section, (result, from_cache) in results.items():
+        print("\n" + "="*60)
+        print(section.replace("_", " ").upper())
+        print("="*60)
+        _print_result(result, force=from_cache)
+
+def _handle_about(gabriel_ai, arg):
+    print("\n" + "="*60)
+    print("ABOUT GABRIEL MANSO")
+    print("="*60)
+    print(f"🎓 {_ORG} Graduate Student")
+    print(f"🔬 Research Focus: AI effectiveness in scientific computing")
+    print(f"📊 Current Project: Meta-analysis of 2,400+ pairwise comparisons")
+    print(f"📍 Location: {_LOCATION}")
+    print(f"🎵 Musical Passion: {_GENRES}")
+    print(f"🎸 Favorite Artists: {_BANDS}")
+    print(f"💭 Core Values: {_VALUES_STR}")
+    print(f"🎯 Strengths: {_STRENGTHS_STR}")
+
+def _handle_help(gabriel_ai, arg):
+    print("\n📋 Available Commands:")
+    print("• intro (or 1) - Gabriel's introduction for class/meetings")
+    print("• research [topic] (or 2 [topic]) - Comprehensive research synthesis")
+    print("• music (or 3) - Personalized music recommendations")
+    print("• about (or 4) - Gabriel's background and research")
+    print("• help (or 5) - Show this help menu")
+    print("• quit (or 6) - Exit the system")
+
+def _handle_unknown(gabriel_ai, arg):
+    print("❌ Command not recognized. Type 'help' or '5' for available commands.")
+    print("💡 Tip: You can use numbers (1-6) or words (intro, research, music, about, help, quit)")
+
+_QUIT_COMMANDS = frozenset({"quit", "exit", "6"})
+
+_COMMAND_TABLE = {
+    "intro": _handle_intro, "1": _handle_intro,
+    "research": _handle_research, "2": _handle_research,
+    "music": _handle_music, "3": _handle_music,
+    "all": _handle_all,
+    "about": _handle_about, "4": _handle_about,
+    "help": _handle_help, "5": _handle_help,
+}
 
 def run_interactive_session():
     print("=" * 70)
@@ -352,6 +683,7 @@ def run_interactive_session():
     print("2. 'research [topic]' or '2 [topic]' - Research synthesis on any topic")  
     print("3. 'music' or '3' - Get personalized music recommendations")
     print("4. 'about' or '4' - Learn more about Gabriel's research and background")
+    print("   'all [topic]' - Run intro, research, and music concurrently")
     print("5. 'help' or '5' - Show this help menu")
     print("6. 'quit' or '6' - Exit the system")
     print("=" * 70)
@@ -368,74 +700,13 @@ def run_interactive_session():
             user_input = input("\n🎯 Como posso ajudar? (How can I help?) ").strip().lower()
             user_input = user_input.strip("'\"")
             
-            if user_input in ['quit', 'exit', '6']:
+            if user_input in _QUIT_COMMANDS:
                 print("\n👋 Até logo! Thanks for using Gabriel's AI system!")
                 break
-                
-            elif user_input in ['intro', '1']:
-                print("\n" + "="*60)
-                print("GABRIEL'S CLASS INTRODUCTION")
-                print("="*60)
-                result = gabriel_ai.introduce_gabriel()
-                print(result)
-                
-            elif user_input.startswith('research ') or user_input.startswith('2 '):
-                if user_input.startswith('2 '):
-                    topic = user_input[2:].strip()
-                else:
-                    topic = user_input[9:].strip()
-                    
-                if topic:
-                    print("\n" + "="*60)
-                    print(f"RESEARCH SYNTHESIS: {topic.upper()}")
-                    print("="*60)
-                    result = gabriel_ai.research_topic(topic)
-                    print(result)
-                else:
-                    print("❌ Please specify a research topic.")
-                    print("Example: 'research AI in scientific computing' or '2 quantum computing'")
-                    
-            elif user_input in ['music', '3']:
-                print("\n" + "="*60) 
-                print("MUSIC RECOMMENDATIONS FOR GABRIEL")
-                print("="*60)
-                result = gabriel_ai.get_music_recommendations()
-                print(result)
-                
-            elif user_input in ['about', '4']:
-                print("\n" + "="*60)
-                print("ABOUT GABRIEL MANSO")
-                print("="*60)
-                name = PERSONA["identity"]["name"]
-                org = PERSONA["identity"]["org"]
-                location = PERSONA["identity"]["location"]
-                strengths = ", ".join(PERSONA["strengths"])
-                values = ", ".join(PERSONA["values"])
-                bands = PERSONA["passions"]["music"]["bands"]
-                genres = PERSONA["passions"]["music"]["genres"]
-                
-                print(f"🎓 {org} Graduate Student")
-                print(f"🔬 Research Focus: AI effectiveness in scientific computing")
-                print(f"📊 Current Project: Meta-analysis of 2,400+ pairwise comparisons")
-                print(f"📍 Location: {location}")
-                print(f"🎵 Musical Passion: {genres}")
-                print(f"🎸 Favorite Artists: {bands}")
-                print(f"💭 Core Values: {values}")
-                print(f"🎯 Strengths: {strengths}")
-                
-            elif user_input in ['help', '5']:
-                print("\n📋 Available Commands:")
-                print("• intro (or 1) - Gabriel's introduction for class/meetings")
-                print("• research [topic] (or 2 [topic]) - Comprehensive research synthesis")
-                print("• music (or 3) - Personalized music recommendations") 
-                print("• about (or 4) - Gabriel's background and research")
-                print("• help (or 5) - Show this help menu")
-                print("• quit (or 6) - Exit the system")
-                
-            else:
-                print("❌ Command not recognized. Type 'help' or '5' for available commands.")
-                print("💡 Tip: You can use numbers (1-6) or words (intro, research, music, about, help, quit)")
-                
+
+            cmd, _, arg = user_input.partition(" ")
+            _COMMAND_TABLE.get(cmd, _handle_unknown)(gabriel_ai, arg)
+
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted by user. Até logo!")
             break
@@ -449,7 +720,8 @@ def test_system():
     try:
         gabriel_ai = GabrielCrewAI()
         print("✅ System initialization: PASSED")
-        
+
+        # Agents/tasks/crew are lazy - touch them explicitly to validate.
         assert len(gabriel_ai.agents) == 3
         print("✅ Agent creation: PASSED")
         
@@ -1,11 +1,45 @@
+import functools
+import hashlib
+import json
 import os
 import re
-from datetime import datetime
-from crewai import Agent, Task, Crew, Process, LLM
-from crewai_tools import SerperDevTool
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+# Opt-in Rust-backed LiteLLM drop-in. Must be registered before crewai
+# imports litellm, so it runs at module load, ahead of the lazy crewai
+# import below. The shim exposes
+# the same completion/acompletion API with far less per-call Python
+# dispatch; behavior is unchanged when the package or flag is absent.
+if os.getenv("USE_RUST_LITELLM") == "1":
+    try:
+        import edgequake_litellm
+        sys.modules["litellm"] = edgequake_litellm
+    except ImportError:
+        pass
+
 from typing import Dict
 import asyncio
 
+# crewai / crewai_tools pull in litellm, pydantic, openai, and the Serper
+# SDK — seconds of import work that short-lived invocations (CI,
+# test_system) shouldn't pay at module load. They are imported on first
+# use via _lazy_crewai(); the names stay module globals so annotations
+# and call sites read the same as with eager imports.
+Agent = Task = Crew = Process = LLM = SerperDevTool = None
+
+def _lazy_crewai():
+    """Import crewai and crewai_tools on first use, once per process."""
+    global Agent, Task, Crew, Process, LLM, SerperDevTool
+    if Agent is None:
+        from crewai import Agent, Task, Crew, Process, LLM
+        from crewai_tools import SerperDevTool
+
 # Load environment variables from .env file if it exists
 try:
     from dotenv import load_dotenv
@@ -13,6 +47,17 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Optional embedding stack for the semantic cache
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
 #--------------------------------
 # Fix for asyncio deprecation warning in Python 3.12
 # This patches the deprecated asyncio.get_event_loop() behavior in litellm
@@ -42,31 +87,268 @@ _patch_asyncio_deprecation()
 # Required for model calls: ANTHROPIC_API_KEY
 # Optional for search tool: SERPER_API_KEY
 
+_HTTP_SESSION_CONFIGURED = False
+
+def _configure_shared_http_session():
+    """
+    Give LiteLLM one long-lived HTTP client instead of a fresh connection
+    pool per completion call. Keep-alive reuses the TLS session to
+    Anthropic, saving DNS + handshake (~50-150 ms) on every warm call.
+    LiteLLM is httpx-based, so the shared clients are httpx ones.
+    """
+    global _HTTP_SESSION_CONFIGURED
+    if _HTTP_SESSION_CONFIGURED:
+        return
+    try:
+        import httpx
+        import litellm
+    except ImportError:
+        return
+    if getattr(litellm, "client_session", None) is None:
+        litellm.client_session = httpx.Client(timeout=600)
+    if getattr(litellm, "aclient_session", None) is None:
+        litellm.aclient_session = httpx.AsyncClient(timeout=600)
+    _HTTP_SESSION_CONFIGURED = True
+
+# Verbose agent/crew logging prints every step, tool call, and LLM
+# response to stdout — synchronous I/O on the request-handling thread.
+# Off by default; opt in with GABRIEL_VERBOSE=1 when debugging.
+_VERBOSE = os.getenv("GABRIEL_VERBOSE", "0") == "1"
+
+_SERPER_SESSION_CONFIGURED = False
+
+def _configure_serper_session():
+    """
+    Route SerperDevTool's HTTP through one pooled requests.Session.
+    The tool module calls requests.post() directly, so each search paid a
+    fresh TLS handshake to google.serper.dev; a Session with keep-alive
+    reuses connections across tool invocations and across agents. The
+    Session exposes the same post/get API, so swapping it in for the
+    module's `requests` reference is behavior-preserving.
+    """
+    global _SERPER_SESSION_CONFIGURED
+    if _SERPER_SESSION_CONFIGURED:
+        return
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        import crewai_tools.tools.serper_dev_tool.serper_dev_tool as _serper_mod
+    except ImportError:
+        return
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ))
+    _serper_mod.requests = session
+    _SERPER_SESSION_CONFIGURED = True
+
+@functools.lru_cache(maxsize=1)
 def create_llm():
     """
     Create LLM using Anthropic via CrewAI's LLM wrapper.
-    Requires ANTHROPIC_API_KEY in the environment.
+    Requires ANTHROPIC_API_KEY in the environment. Memoized so repeated
+    GabrielCrewAI constructions share one wrapper instead of re-paying
+    LiteLLM provider discovery; the config only depends on the
+    environment, so one instance per process is safe.
     """
     anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
     if not anthropic_api_key:
         raise RuntimeError("ANTHROPIC_API_KEY is required to run this agent")
 
+    _lazy_crewai()
+    _configure_shared_http_session()
+
     print("🤖 Using Anthropic (Claude) via CrewAI LLM...")
-    # CrewAI LLM uses LiteLLM under the hood; provider prefix 'anthropic/'
+    # CrewAI LLM uses LiteLLM under the hood; provider prefix 'anthropic/'.
+    # The beta header opts every call into Anthropic prompt caching, so
+    # the shared persona prefix in each system prompt is a cache hit on
+    # repeat calls instead of re-billed, re-processed tokens.
     return LLM(
         model="anthropic/claude-3-haiku-20240307",
         temperature=0.2,
-        api_key=anthropic_api_key
+        api_key=anthropic_api_key,
+        extra_headers={"anthropic-beta": "prompt-caching-2024-07-31"}
     )
 
-# Simple sanitizer to remove stage directions or emphasis wrapped in asterisks
+class LLMCache:
+    """
+    Small in-memory LRU + TTL cache for crew results.
+    The intro/music/freeform prompts are essentially identical between
+    invocations, so a hit skips an entire Anthropic round-trip.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, text)
+
+    @staticmethod
+    def key_for(model: str, description: str, expected_output: str) -> str:
+        payload = json.dumps(
+            {"m": model, "d": description, "e": expected_output},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return text
+
+    def set(self, key, text, ttl=None):
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), text)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_RESPONSE_CACHE = LLMCache()
+
+class SemanticCache:
+    """
+    Cache keyed on embedding similarity instead of exact text.
+    research_topic and converse_freeform receive free-form strings, so
+    exact matching rarely hits; embedding lookups let paraphrased queries
+    reuse a previous response. When the optional sentence-transformers /
+    numpy stack is unavailable, it degrades to normalized exact matching.
+    Entries carry their own embedding and expiry and are persisted to a
+    JSON file so hits survive restarts; the short TTL keeps cached
+    research inside the prompts' recency window. A lock guards the entry
+    list since handle_async dispatches from a thread pool.
+    """
+
+    def __init__(self, path, threshold: float = 0.92, maxsize: int = 256, ttl: float = 900.0):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Each entry: {text, response, embedding (list | None), expires_at}.
+        # Embeddings live with their entry, so a cache written without the
+        # embedding stack and reloaded with it can never pair row i with
+        # the wrong response.
+        self._entries = []
+        self._model = None
+        self._model_failed = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _embed(self, text: str):
+        if SentenceTransformer is None or np is None or self._model_failed:
+            return None
+        try:
+            if self._model is None:
+                self._model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+            vec = self._model.encode([text], normalize_embeddings=True)[0]
+            return np.asarray(vec, dtype=np.float32)
+        except Exception:
+            # sentence-transformers is installed but the model can't load
+            # (no cached weights, no network) or encoding failed. Remember
+            # that and stay on the exact-match path instead of raising out
+            # of every research/freeform call.
+            self._model_failed = True
+            self._model = None
+            return None
+
+    def _prune(self):
+        now = time.time()
+        self._entries = [e for e in self._entries if e.get("expires_at", 0) > now]
+
+    def get(self, text: str):
+        with self._lock:
+            self._prune()
+            if not self._entries:
+                return None
+
+            query = self._embed(text)
+            remaining = self._entries
+            if query is not None:
+                embedded = [e for e in self._entries if e["embedding"] is not None]
+                if embedded:
+                    matrix = np.asarray([e["embedding"] for e in embedded], dtype=np.float32)
+                    sims = matrix @ query
+                    best = int(sims.argmax())
+                    if sims[best] >= self.threshold:
+                        return embedded[best]["response"]
+                    # Entries written without the embedding stack still
+                    # get a chance below via exact matching.
+                    remaining = [e for e in self._entries if e["embedding"] is None]
+
+            normalized = " ".join(text.lower().split())
+            for entry in remaining:
+                if " ".join(entry["text"].lower().split()) == normalized:
+                    return entry["response"]
+            return None
+
+    def set(self, text: str, response: str):
+        with self._lock:
+            embedding = self._embed(text)
+            self._prune()
+            self._entries.append({
+                "text": text,
+                "response": response,
+                "embedding": None if embedding is None else embedding.tolist(),
+                "expires_at": time.time() + self.ttl,
+            })
+            while len(self._entries) > self.maxsize:
+                self._entries.pop(0)
+            self._save()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        entries = data.get("entries")
+        if not isinstance(entries, list):
+            return  # pre-TTL parallel-list layout; start fresh
+        now = time.time()
+        self._entries = [
+            e for e in entries
+            if isinstance(e, dict) and e.get("expires_at", 0) > now
+        ]
+
+    def _save(self):
+        try:
+            self.path.write_text(json.dumps({"entries": self._entries}))
+        except OSError:
+            pass
+
+_SEMANTIC_CACHE = SemanticCache(Path(__file__).resolve().parent / "gabriel_semantic_cache.json")
+
+# Simple sanitizer to remove stage directions or emphasis wrapped in asterisks.
+# Patterns are compiled once at module scope - sanitize_output runs on every
+# NANDA message, so per-call re.sub pattern parsing is pure overhead.
+_ASTERISK_RE = re.compile(r"\*{1,2}[^*\n]{1,200}\*{1,2}", re.ASCII)
+_WHITESPACE_RE = re.compile(r"\s{2,}", re.ASCII)
+
+# Optional compiled single-pass scanner (see sanitize_fast.pyx; build with
+# `cythonize -i sanitize_fast.pyx`). One walk over the byte buffer instead
+# of two regex traversals; the regex pipeline remains the fallback.
+try:
+    from sanitize_fast import sanitize as _sanitize_fast
+except ImportError:
+    _sanitize_fast = None
+
 def sanitize_output(text: str) -> str:
     if not text:
         return text
+    text = str(text)
+    if _sanitize_fast is not None:
+        return _sanitize_fast(text.encode("utf-8")).decode("utf-8")
+    # Fast path: nothing to strip or collapse
+    if "*" not in text and _WHITESPACE_RE.search(text) is None:
+        return text.strip()
     # remove asterisk-wrapped spans like *...* or **...** without crossing newlines
-    cleaned = re.sub(r"\*{1,2}[^*\n]{1,200}\*{1,2}", "", str(text))
+    cleaned = _ASTERISK_RE.sub("", text)
     # collapse excessive whitespace
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
     return cleaned
 
 PERSONA = {
@@ -103,104 +385,198 @@ PERSONA = {
     }
 }
 
+# Derived persona strings, computed once at import. The persona is static,
+# so re-joining and re-indexing these in _create_agents/_create_tasks on
+# every construction is wasted work.
+_NAME = PERSONA["identity"]["name"]
+_ORG = PERSONA["identity"]["org"]
+_LOCATION = PERSONA["identity"]["location"]
+_STRENGTHS = ", ".join(PERSONA["strengths"])
+_VALUES = ", ".join(PERSONA["values"])
+_BANDS = PERSONA["passions"]["music"]["bands"]
+_GENRES = PERSONA["passions"]["music"]["genres"]
+_FORMAT_PREFS = PERSONA["identity"]["format"]
+_RECENCY_DAYS = PERSONA["identity"]["constraints"]["recency_days"]
+_SAFETY_FLAGS = ", ".join(PERSONA["identity"]["constraints"]["safety_flags"])
+
+# The formatted date only changes once a day, but it was being rebuilt via
+# datetime.now().strftime on every agent, task, and research call.
+_TODAY_CACHE = {"date": None, "str": ""}
+
+def _today_str() -> str:
+    """Formatted current date, recomputed only when the day rolls over."""
+    today = date.today()
+    if _TODAY_CACHE["date"] != today:
+        _TODAY_CACHE["date"] = today
+        _TODAY_CACHE["str"] = today.strftime('%B %d, %Y')
+    return _TODAY_CACHE["str"]
+
+# Shared persona block prefixed to every agent backstory. Keeping it one
+# string object (instead of re-interpolating the same ~500 chars into
+# each backstory) means every system prompt Anthropic sees starts with an
+# identical prefix, which is exactly what its prompt cache keys on.
+_PERSONA_PREFIX = f"""You ARE {_NAME} from {_ORG} in {_LOCATION}. You speak exactly like he would -
+            naturally, conversationally, like a real person talking, not giving a formal presentation.
+            You know his strengths: {_STRENGTHS}. His values: {_VALUES}. He loves music, especially {_BANDS}
+            and {_GENRES}. When you talk, sound like Gabriel actually speaking - use "I" not "he",
+            be casual and warm, avoid formal language. Never sound like a report or summary.
+            Just talk like a normal person would."""
+
+# research_topic prompt templates, prebaked at import with the static
+# persona/constraint text. Each call only substitutes the topic and date
+# instead of re-interpolating the whole multi-line description.
+_RESEARCH_DESC_TPL = """Research '{topic}' like Gabriel would - naturally and conversationally.
+            TODAY IS {date} - ALWAYS use 2025 in your search queries, never 2023 or 2024.
+            Use search queries like '{topic} news September 2025' or '{topic} latest updates since last week'
+            or '{topic} latest updates since last week'. Look for recent info (last 15 days from TODAY).
+            Find current data, identify trends, check facts, but talk about what you found like
+            Gabriel would - naturally, like explaining to a friend. Don't write formal reports.
+            Just talk about what you discovered. Avoid medical, legal, or financial advice."""
+
+_RESEARCH_OUTPUT_TPL = """Talk about your research on '{topic}' like Gabriel would - naturally and conversationally.
+            Use TODAY'S DATE ({date}). Cover: (1) What you found (talk about it like you're
+            explaining to someone), (2) Key stuff you discovered in a table if helpful, (3) What you
+            think about it, (4) What it means. Use tables for data if helpful, cite sources, but
+            keep it conversational. Sound like Gabriel talking about the topic, not writing a formal report."""
+
+_BATCH_SERPER_CLS = None
+
+def _batch_serper_tool():
+    """
+    Serper tool that also accepts a list of queries and fans it out
+    across a small thread pool, so the several searches an agent issues
+    per kickoff overlap instead of running back-to-back (~N x 200 ms
+    down to ~1 x). Single queries take the stock path unchanged. The
+    class is defined lazily because SerperDevTool itself is a lazy
+    import; threads over the pooled keep-alive session give the same
+    concurrency as an aiohttp fan-out without putting an event loop
+    inside CrewAI's synchronous tool interface.
+    """
+    global _BATCH_SERPER_CLS
+    _lazy_crewai()
+    if _BATCH_SERPER_CLS is None:
+        class BatchSerperDevTool(SerperDevTool):
+            def _run(self, **kwargs):
+                query = kwargs.get("search_query") or kwargs.get("query")
+                if not isinstance(query, (list, tuple)):
+                    return super()._run(**kwargs)
+                queries = [str(q) for q in query]
+                if not queries:
+                    return ""
+                with ThreadPoolExecutor(max_workers=min(8, len(queries))) as pool:
+                    results = pool.map(
+                        lambda q: super(BatchSerperDevTool, self)._run(search_query=q),
+                        queries,
+                    )
+                    return "\n\n".join(str(r) for r in results)
+
+        _BATCH_SERPER_CLS = BatchSerperDevTool
+    return _BATCH_SERPER_CLS()
+
 class GabrielCrewAI:
+    # Agents and tasks live in slots rather than dicts: the hot paths hit
+    # them on every message, and a slot read is a single LOAD_ATTR versus
+    # a dict hash + lookup. Slots also drop the per-instance __dict__.
+    __slots__ = (
+        "llm", "search_tool",
+        "personal_assistant", "research_synthesizer", "music_curator",
+        "intro_task", "research_task", "music_task",
+        "crew", "_intro_crew", "_music_crew",
+    )
+
     def __init__(self):
+        _lazy_crewai()
         self.llm = create_llm()
-        self.search_tool = SerperDevTool()
-        self.agents = self._create_agents()
-        self.tasks = self._create_tasks()
+        _configure_serper_session()
+        self.search_tool = _batch_serper_tool()
+        self._create_agents()
+        self._create_tasks()
         self.crew = self._create_crew()
-    
-    def _create_agents(self) -> Dict[str, Agent]:
-        name = PERSONA["identity"]["name"]
-        org = PERSONA["identity"]["org"]
-        location = PERSONA["identity"]["location"]
-        strengths = ", ".join(PERSONA["strengths"])
-        values = ", ".join(PERSONA["values"])
-        bands = PERSONA["passions"]["music"]["bands"]
-        genres = PERSONA["passions"]["music"]["genres"]
-        recency_days = PERSONA["identity"]["constraints"]["recency_days"]
-        safety_flags = ", ".join(PERSONA["identity"]["constraints"]["safety_flags"])
+        # Pre-built single-agent crews reused across handler invocations,
+        # so the hot request path doesn't reconstruct Crew objects per message.
+        self._intro_crew = Crew(
+            agents=[self.personal_assistant],
+            tasks=[self.intro_task],
+            process=Process.sequential,
+            verbose=_VERBOSE
+        )
+        self._music_crew = Crew(
+            agents=[self.music_curator],
+            tasks=[self.music_task],
+            process=Process.sequential,
+            verbose=_VERBOSE
+        )
+
+    def _create_agents(self) -> None:
+        name = _NAME
+        recency_days, safety_flags = _RECENCY_DAYS, _SAFETY_FLAGS
         
-        personal_assistant = Agent(
+        self.personal_assistant = Agent(
             role="Personal Identity Representative",
             goal=f"Talk exactly like {name} would - natural, conversational, human",
-            backstory=f"""You ARE {name} from {org} in {location}. You speak exactly like he would - 
-            naturally, conversationally, like a real person talking, not giving a formal presentation. 
-            You know his strengths: {strengths}. His values: {values}. He loves music, especially {bands} 
-            and {genres}. When you talk, sound like Gabriel actually speaking - use "I" not "he", 
-            be casual and warm, avoid formal language. Never sound like a report or summary. 
-            Just talk like a normal person would.""",
-            verbose=True,
+            backstory=_PERSONA_PREFIX,
+            verbose=_VERBOSE,
             allow_delegation=False,
             llm=self.llm,
-            max_iter=3
+            # No tools and no delegation: extra ReAct iterations can only
+            # re-ask the same question, so one pass is enough.
+            max_iter=1
         )
         
-        research_synthesizer = Agent(
+        self.research_synthesizer = Agent(
             role="Research Synthesis Specialist",
             goal=f"Research topics the way {name} would - naturally and conversationally",
-            backstory=f"""You ARE {name} doing research. You have his strengths: {strengths} and values: {values}. 
-            When you research something, talk about it like Gabriel would - naturally, conversationally, 
-            like you're explaining it to a friend. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use this date 
-            in your search queries. For search queries, use formats like: "topic news September 2025" or "topic latest updates since last week". 
-            NEVER use years like 2023 or 2024, and always use specify the month and date. 
-            Focus on recent stuff (last {recency_days} days from TODAY). Don't write formal reports or summaries - 
-            just talk about what you found like a normal person would. Use tables if helpful, cite sources, 
-            but keep it conversational. Never sound academic or formal. Just be Gabriel talking about 
+            backstory=_PERSONA_PREFIX + f"""
+
+            You are doing research. TODAY IS {_today_str()} - ALWAYS use this date
+            in your search queries. For search queries, use formats like: "topic news September 2025" or "topic latest updates since last week".
+            NEVER use years like 2023 or 2024, and always use specify the month and date.
+            Focus on recent stuff (last {recency_days} days from TODAY). Don't write formal reports or summaries -
+            just talk about what you found like a normal person would. Use tables if helpful, cite sources,
+            but keep it conversational. Never sound academic or formal. Just be Gabriel talking about
             what he discovered. Avoid {safety_flags} advice.
-            
-            IMPORTANT: Be natural and conversational. Don't repeat the same phrases. Don't over-explain. 
-            Don't use repetitive language. Just talk about what you found naturally, like you're sharing 
+
+            IMPORTANT: Be natural and conversational. Don't repeat the same phrases. Don't over-explain.
+            Don't use repetitive language. Just talk about what you found naturally, like you're sharing
             interesting discoveries with a friend.""",
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
             tools=[self.search_tool],
             llm=self.llm,
             max_iter=3
         )
         
-        music_curator = Agent(
+        self.music_curator = Agent(
             role="Music Intelligence Curator",
             goal=f"Recommend music like {name} would - naturally and enthusiastically",
-            backstory=f"""You ARE {name} talking about music. You love {bands} and {genres}. 
-            When you recommend music, talk about it like Gabriel would - excitedly, naturally, 
-            like you're sharing cool stuff with a friend. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use this date 
-            in your search queries. For music searches, use formats like: "psychedelic indie rock releases 2025" 
-            or "progressive rock new albums September 2025" or "indie rock latest 2025". 
-            NEVER use years like 2023 or 2024, and always use specify the month and date. 
-            
-            IMPORTANT: When recommending music, be natural and conversational. Don't use repetitive phrases like 
-            "There's a bit of a psychedelic edge" over and over. Don't over-explain obvious things. 
-            Don't use numbered lists mixed with conversational text. Just talk naturally about what you found, 
-            why it's cool, and what makes it special. Be enthusiastic but not repetitive. Keep it flowing 
+            backstory=_PERSONA_PREFIX + f"""
+
+            You are talking about music. When you recommend music, talk about it excitedly, naturally,
+            like you're sharing cool stuff with a friend. TODAY IS {_today_str()} - ALWAYS use this date
+            in your search queries. For music searches, use formats like: "psychedelic indie rock releases 2025"
+            or "progressive rock new albums September 2025" or "indie rock latest 2025".
+            NEVER use years like 2023 or 2024, and always use specify the month and date.
+
+            IMPORTANT: When recommending music, be natural and conversational. Don't use repetitive phrases like
+            "There's a bit of a psychedelic edge" over and over. Don't over-explain obvious things.
+            Don't use numbered lists mixed with conversational text. Just talk naturally about what you found,
+            why it's cool, and what makes it special. Be enthusiastic but not repetitive. Keep it flowing
             like a real conversation. Avoid awkward phrases and redundant explanations.""",
-            verbose=True,
+            verbose=_VERBOSE,
             allow_delegation=False,
             tools=[self.search_tool],
             llm=self.llm,
             max_iter=3
         )
+
+    def _create_tasks(self) -> None:
+        name, org, location = _NAME, _ORG, _LOCATION
+        strengths, values = _STRENGTHS, _VALUES
+        bands, genres = _BANDS, _GENRES
+        format_prefs = _FORMAT_PREFS
+        recency_days, safety_flags = _RECENCY_DAYS, _SAFETY_FLAGS
         
-        return {
-            "personal_assistant": personal_assistant,
-            "research_synthesizer": research_synthesizer, 
-            "music_curator": music_curator
-        }
-    
-    def _create_tasks(self) -> Dict[str, Task]:
-        name = PERSONA["identity"]["name"]
-        org = PERSONA["identity"]["org"]
-        location = PERSONA["identity"]["location"]
-        strengths = ", ".join(PERSONA["strengths"])
-        values = ", ".join(PERSONA["values"])
-        bands = PERSONA["passions"]["music"]["bands"]
-        genres = PERSONA["passions"]["music"]["genres"]
-        format_prefs = PERSONA["identity"]["format"]
-        recency_days = PERSONA["identity"]["constraints"]["recency_days"]
-        safety_flags = ", ".join(PERSONA["identity"]["constraints"]["safety_flags"])
-        
-        introduction_task = Task(
+        self.intro_task = Task(
             description=f"""Introduce yourself as {name} would - naturally and conversationally. 
             Talk about being a {org} grad student, your research, living in {location}, your values 
             ({values}), your strengths ({strengths}), and your love for music ({bands}, {genres}). 
@@ -210,29 +586,29 @@ class GabrielCrewAI:
             (2) Where you're from and live ({location}), (3) What matters to you ({values}) and 
             what you're good at ({strengths}), (4) Your music passion ({bands}, {genres}). 
             Sound like a real person talking, not a formal bio.""",
-            agent=self.agents["personal_assistant"]
+            agent=self.personal_assistant
         )
-        
-        research_task = Task(
+
+        self.research_task = Task(
             description=f"""Research a topic the way {name} would - naturally and conversationally. 
-            Use your strengths: {strengths} and values: {values}. TODAY IS {datetime.now().strftime('%B %d, %Y')} - 
+            Use your strengths: {strengths} and values: {values}. TODAY IS {_today_str()} - 
             ALWAYS use 2025 in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like: 
             "topic news September 2025" or "topic latest updates since last week". 
             Focus on recent stuff (last {recency_days} days from TODAY). Find key trends, check facts, 
             but talk about what you found like Gabriel would - naturally, like explaining to a friend. 
             Don't write formal reports. Just talk about what you discovered. Avoid {safety_flags} advice.""",
             expected_output=f"""Talk about your research findings like Gabriel would - naturally and conversationally. 
-            Use TODAY'S DATE ({datetime.now().strftime('%B %d, %Y')}). Cover: (1) What you found (talk about it 
+            Use TODAY'S DATE ({_today_str()}). Cover: (1) What you found (talk about it 
             like you're explaining to someone), (2) Key stuff you discovered {'in a table if helpful' if format_prefs['tables'] else 'just talk about it'}, 
             (3) What you think about it, (4) What it means. {'Use tables for data' if format_prefs['tables'] else 'Just talk naturally'}, 
             {'cite sources' if format_prefs['citations'] else 'mention where you found stuff'}. 
             Sound like Gabriel talking about research, not writing a formal report.""",
-            agent=self.agents["research_synthesizer"]
+            agent=self.research_synthesizer
         )
-        
-        music_recommendation_task = Task(
+
+        self.music_task = Task(
             description=f"""Recommend music like {name} would - naturally and enthusiastically. 
-            You love {bands} and {genres}. TODAY IS {datetime.now().strftime('%B %d, %Y')} - ALWAYS use 2025 
+            You love {bands} and {genres}. TODAY IS {_today_str()} - ALWAYS use 2025 
             in your search queries, never 2023 or 2024, and always use specify the month and date. Use search formats like: "psychedelic indie rock releases since last week" 
             or "progressive rock new albums September 2025". Find both classic stuff he might have missed and new 
             releases that match his taste. Focus on what's actually good and interesting.
@@ -245,78 +621,80 @@ class GabrielCrewAI:
             don't over-explain obvious things, don't mix formats awkwardly. Just talk about what you discovered, 
             why it's cool, and what makes it special. Keep it flowing like a real conversation. 
             Sound like Gabriel talking about music he's excited about, not writing a formal report.""",
-            agent=self.agents["music_curator"]
+            agent=self.music_curator
         )
-        
-        return {
-            "introduction": introduction_task,
-            "research": research_task,
-            "music_recommendation": music_recommendation_task
-        }
-    
+
     def _create_crew(self) -> Crew:
         return Crew(
-            agents=list(self.agents.values()),
-            tasks=list(self.tasks.values()),
+            agents=[self.personal_assistant, self.research_synthesizer, self.music_curator],
+            tasks=[self.intro_task, self.research_task, self.music_task],
             process=Process.sequential,
-            verbose=True
+            verbose=_VERBOSE
         )
     
+    def _cache_key(self, task: Task) -> str:
+        return LLMCache.key_for(
+            getattr(self.llm, "model", ""), task.description, task.expected_output
+        )
+
     def introduce_gabriel(self) -> str:
+        key = self._cache_key(self.intro_task)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            print("🎤 Generating Gabriel's introduction... (cached)")
+            return cached
+
         print("🎤 Generating Gabriel's introduction...")
-        
-        intro_crew = Crew(
-            agents=[self.agents["personal_assistant"]],
-            tasks=[self.tasks["introduction"]], 
-            process=Process.sequential,
-            verbose=True
-        )
-        
-        return intro_crew.kickoff()
+        result = str(self._intro_crew.kickoff())
+        _RESPONSE_CACHE.set(key, result)
+        return result
     
     def research_topic(self, topic: str) -> str:
+        cache_text = f"research: {topic}"
+        cached = _SEMANTIC_CACHE.get(cache_text)
+        if cached is not None:
+            print(f"🔍 Researching: {topic} (semantic cache hit)")
+            return cached
+
         print(f"🔍 Researching: {topic}")
-        
-        current_date = datetime.now().strftime('%B %d, %Y')
+
+        current_date = _today_str()
         research_task = Task(
-            description=f"""Research '{topic}' like Gabriel would - naturally and conversationally. 
-            TODAY IS {current_date} - ALWAYS use 2025 in your search queries, never 2023 or 2024. 
-            Use search queries like '{topic} news September 2025' or '{topic} latest updates since last week' 
-            or '{topic} latest updates since last week'. Look for recent info (last 15 days from TODAY). 
-            Find current data, identify trends, check facts, but talk about what you found like 
-            Gabriel would - naturally, like explaining to a friend. Don't write formal reports. 
-            Just talk about what you discovered. Avoid medical, legal, or financial advice.""",
-            expected_output=f"""Talk about your research on '{topic}' like Gabriel would - naturally and conversationally. 
-            Use TODAY'S DATE ({current_date}). Cover: (1) What you found (talk about it like you're 
-            explaining to someone), (2) Key stuff you discovered in a table if helpful, (3) What you 
-            think about it, (4) What it means. Use tables for data if helpful, cite sources, but 
-            keep it conversational. Sound like Gabriel talking about the topic, not writing a formal report.""",
-            agent=self.agents["research_synthesizer"]
+            description=_RESEARCH_DESC_TPL.format(topic=topic, date=current_date),
+            expected_output=_RESEARCH_OUTPUT_TPL.format(topic=topic, date=current_date),
+            agent=self.research_synthesizer
         )
         
         research_crew = Crew(
-            agents=[self.agents["research_synthesizer"]],
+            agents=[self.research_synthesizer],
             tasks=[research_task],
             process=Process.sequential,
-            verbose=True
+            verbose=_VERBOSE
         )
-        
-        return research_crew.kickoff()
+
+        result = str(research_crew.kickoff())
+        _SEMANTIC_CACHE.set(cache_text, result)
+        return result
     
     def get_music_recommendations(self) -> str:
+        key = self._cache_key(self.music_task)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            print("🎵 Generating music recommendations... (cached)")
+            return cached
+
         print("🎵 Generating music recommendations...")
-        
-        music_crew = Crew(
-            agents=[self.agents["music_curator"]],
-            tasks=[self.tasks["music_recommendation"]],
-            process=Process.sequential,
-            verbose=True
-        )
-        
-        return music_crew.kickoff()
+        result = str(self._music_crew.kickoff())
+        _RESPONSE_CACHE.set(key, result)
+        return result
 
     def converse_freeform(self, user_text: str) -> str:
         """Respond naturally as Gabriel to arbitrary user input."""
+        cache_text = f"freeform: {user_text}"
+        cached = _SEMANTIC_CACHE.get(cache_text)
+        if cached is not None:
+            return cached
+
         prompt = (
             f"Respond exactly as Gabriel would, in plain text, no stage directions, "
             f"no markdown emphasis. Keep it natural and concise. User said: '{user_text}'."
@@ -324,15 +702,46 @@ class GabrielCrewAI:
         task = Task(
             description=prompt,
             expected_output="A natural, concise plain-text reply matching Gabriel's persona.",
-            agent=self.agents["personal_assistant"]
+            agent=self.personal_assistant
         )
+
+        key = self._cache_key(task)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         convo_crew = Crew(
-            agents=[self.agents["personal_assistant"]],
+            agents=[self.personal_assistant],
             tasks=[task],
             process=Process.sequential,
-            verbose=True
+            verbose=_VERBOSE
         )
-        return convo_crew.kickoff()
+        result = str(convo_crew.kickoff())
+        _RESPONSE_CACHE.set(key, result)
+        _SEMANTIC_CACHE.set(cache_text, result)
+        return result
+
+    async def run_all_async(self, topic: str = "AI in scientific computing") -> Dict[str, str]:
+        """
+        Run the introduction, research, and music tasks concurrently.
+        The three tasks have no data dependencies - each just talks to
+        Anthropic and Serper - so asyncio.gather brings wall time down to
+        the slowest branch instead of the sum of all three.
+        """
+        introduction, research, music = await asyncio.gather(
+            asyncio.to_thread(self.introduce_gabriel),
+            asyncio.to_thread(self.research_topic, topic),
+            asyncio.to_thread(self.get_music_recommendations),
+        )
+        return {
+            "introduction": introduction,
+            "research": research,
+            "music_recommendation": music,
+        }
+
+    def run_all(self, topic: str = "AI in scientific computing") -> Dict[str, str]:
+        """Synchronous wrapper around run_all_async."""
+        return asyncio.run(self.run_all_async(topic))
 
 def test_system():
     print("🧪 Testing Gabriel AI System...")
@@ -341,10 +750,12 @@ def test_system():
         gabriel_ai = GabrielCrewAI()
         print("✅ System initialization: PASSED")
         
-        assert len(gabriel_ai.agents) == 3
+        for attr in ("personal_assistant", "research_synthesizer", "music_curator"):
+            assert getattr(gabriel_ai, attr) is not None
         print("✅ Agent creation: PASSED")
         
-        assert len(gabriel_ai.tasks) == 3
+        for attr in ("intro_task", "research_task", "music_task"):
+            assert getattr(gabriel_ai, attr) is not None
         print("✅ Task creation: PASSED")
         
         assert gabriel_ai.crew is not None
@@ -370,22 +781,44 @@ if __name__ == "__main__":
     def make_nanda_handler():
         gabriel = GabrielCrewAI()
 
+        # Bounded worker pool for the multi-second crew kickoffs. NANDA
+        # invokes the handler synchronously, so the registered callable stays
+        # sync; handle_async is for event-loop hosts, which must not block
+        # the loop thread on a blocking kickoff (that would serialize every
+        # concurrent user message).
+        executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+
         def handle(message_text: str) -> str:
             text = (message_text or "").strip()
-            low = text.lower()
+            # Dispatch on the first token only — casefolding just that
+            # token avoids allocating a lowercased copy of the whole
+            # message on every request.
+            cmd, _, rest = text.partition(" ")
+            cmd = cmd.casefold()
 
-            if low in {"intro", "1"}:
+            if cmd in ("intro", "1"):
                 return sanitize_output(str(gabriel.introduce_gabriel()))
-            if low in {"music", "3"}:
+            if cmd in ("music", "3"):
                 return sanitize_output(str(gabriel.get_music_recommendations()))
-            if low.startswith("2 "):
-                return sanitize_output(str(gabriel.research_topic(text[2:].strip())))
-            if low.startswith("research "):
-                return sanitize_output(str(gabriel.research_topic(text[len("research "):].strip())))
+            if cmd in ("2", "research"):
+                topic = rest.strip()
+                # A bare "research"/"2" has no topic; the baseline sent
+                # that to the freeform persona reply, not an empty crew run.
+                if topic:
+                    return sanitize_output(str(gabriel.research_topic(topic)))
+            if cmd == "all":
+                topic = rest.strip() or "AI in scientific computing"
+                results = gabriel.run_all(topic)
+                return "\n\n".join(sanitize_output(str(part)) for part in results.values())
 
             # Default: respond freeform per Gabriel persona
             return sanitize_output(str(gabriel.converse_freeform(text)))
 
+        async def handle_async(message_text: str) -> str:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, handle, message_text)
+
+        handle.handle_async = handle_async
         return handle
 
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
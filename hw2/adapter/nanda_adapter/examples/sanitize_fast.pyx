@@ -0,0 +1,67 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Single-pass sanitizer used by gabriel.py when compiled.
+
+Replaces the two-regex pipeline (asterisk-span removal followed by
+whitespace collapse) with one walk over the byte buffer, tracking the
+current asterisk span and whitespace run instead of re-scanning the
+string. Build in place with:
+
+    cythonize -i sanitize_fast.pyx
+
+gabriel.py falls back to the regex pipeline when this module isn't built.
+"""
+
+cpdef bytes sanitize(const unsigned char[::1] buf):
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef bytearray out = bytearray()
+    cdef Py_ssize_t i = 0, j, stars, close, span_len, ws_end
+    cdef unsigned char c
+    while i < n:
+        c = buf[i]
+        if c == 42:  # '*'
+            # candidate span: 1-2 asterisks, 1-200 non-*/newline chars, 1-2 asterisks
+            stars = 1
+            if i + 1 < n and buf[i + 1] == 42:
+                stars = 2
+            j = i + stars
+            span_len = 0
+            close = -1
+            while j < n and span_len <= 200:
+                if buf[j] == 42:
+                    close = j
+                    break
+                if buf[j] == 10:  # newline terminates any candidate span
+                    break
+                j += 1
+                span_len += 1
+            if close != -1 and span_len >= 1:
+                # drop the span, consuming a 1-2 asterisk closing run
+                j = close + 1
+                if j < n and buf[j] == 42:
+                    j += 1
+                i = j
+                continue
+            out.append(c)
+            i += 1
+        elif c == 32 or c == 9 or c == 10 or c == 13 or c == 11 or c == 12:
+            # whitespace run: keep a single char as-is, collapse 2+ to one
+            # space. A removed span can leave whitespace adjacent in the
+            # output that wasn't adjacent in the source, so runs also merge
+            # with trailing output whitespace.
+            ws_end = i
+            while ws_end < n and (buf[ws_end] == 32 or buf[ws_end] == 9 or
+                                  buf[ws_end] == 10 or buf[ws_end] == 13 or
+                                  buf[ws_end] == 11 or buf[ws_end] == 12):
+                ws_end += 1
+            if len(out) > 0 and (out[-1] == 32 or out[-1] == 9 or out[-1] == 10 or
+                                 out[-1] == 13 or out[-1] == 11 or out[-1] == 12):
+                out[-1] = 32
+            elif ws_end - i == 1:
+                out.append(c)
+            else:
+                out.append(32)
+            i = ws_end
+        else:
+            out.append(c)
+            i += 1
+    return bytes(out).strip()
@@ -1,35 +1,89 @@
 # Standard library imports
+import argparse
+import hashlib
+import importlib.util
+import json
+import operator
 import os
+import re
 import platform
 import subprocess
 import tempfile
+import threading
+import time
 import uuid
 import warnings
-from datetime import datetime
+from collections import OrderedDict, deque
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from contextlib import contextmanager
 
 # Third-party imports
 import asyncio
-from crewai import Agent, Task, Crew, Process, LLM
-from crewai_tools import SerperDevTool
 
-# Optional imports with fallbacks
-try:
-    import sounddevice as sd
-except ImportError:
-    sd = None
+# Heavy third-party modules are imported on first use so chat-only mode
+# never pays for torch/whisper metadata and `import gabriel` stays
+# lightweight. The names remain module globals with the same None-when-
+# unavailable convention the optional imports used.
+Agent = Task = Crew = Process = LLM = SerperDevTool = None
+sd = None   # sounddevice
+sf = None   # soundfile
+whisper = None
+WhisperModel = None  # faster-whisper (preferred STT backend)
 
-try:
-    import soundfile as sf
-except ImportError:
-    sf = None
+def _lazy_crewai():
+    """Import crewai and crewai_tools on first use, once per process."""
+    global Agent, Task, Crew, Process, LLM, SerperDevTool
+    if Agent is None:
+        from crewai import Agent, Task, Crew, Process, LLM
+        from crewai_tools import SerperDevTool
 
-try:
-    import whisper
-except ImportError:
-    whisper = None
+_AUDIO_IMPORTED = False
+
+def _lazy_audio():
+    """Import sounddevice/soundfile on first audio use; both stay None
+    when unavailable, matching the old optional-import behavior."""
+    global _AUDIO_IMPORTED, sd, sf
+    if _AUDIO_IMPORTED:
+        return
+    _AUDIO_IMPORTED = True
+    try:
+        import sounddevice
+        sd = sounddevice
+    except ImportError:
+        pass
+    try:
+        import soundfile
+        sf = soundfile
+    except ImportError:
+        pass
+
+_STT_IMPORTED = False
+
+def _lazy_stt():
+    """Import an STT backend on first use: faster-whisper (CTranslate2
+    runs Whisper quantized — int8 on CPU, int8_float16 on CUDA — several
+    times faster than reference FP32 PyTorch) with the reference whisper
+    package as fallback. STT_BACKEND=whisper forces the reference
+    package, e.g. to compare output quality between the two."""
+    global _STT_IMPORTED, whisper, WhisperModel
+    if _STT_IMPORTED:
+        return
+    _STT_IMPORTED = True
+    if os.getenv("STT_BACKEND", "").lower() != "whisper":
+        try:
+            from faster_whisper import WhisperModel as _WhisperModel
+            WhisperModel = _WhisperModel
+        except ImportError:
+            pass
+    try:
+        import whisper as _whisper
+        whisper = _whisper
+    except ImportError:
+        pass
 
 
 try:
@@ -45,6 +99,31 @@ DEFAULT_TTS_RATE = 175
 DEFAULT_KOKORO_SAMPLE_RATE = 24000
 VOICE_ARTIFACTS_DIR = Path(__file__).resolve().parent / "voice_artifacts"
 
+# Sentence boundaries for parallel TTS chunking
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _split_for_tts(text: str, max_chars: int = 300):
+    """Pack sentences greedily into groups of at most max_chars.
+
+    Bounding each synthesis call keeps long LLM replies away from
+    Kokoro's output-length cap and caps peak audio memory at one group,
+    while still giving the pipeline pieces big enough to avoid per-call
+    overhead on every short sentence.
+    """
+    groups = []
+    current = ""
+    for sentence in _SENTENCE_RE.split(text):
+        if not sentence.strip():
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            groups.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        groups.append(current)
+    return groups
+
 # Voice mapping for TTS
 VOICE_MAPPING = {
     "alloy": "af_heart", "echo": "af_heart", "fable": "af_heart",
@@ -69,10 +148,8 @@ PERSONA = {
 # Configuration functions
 def _configure_environment():
     """Set default environment variables."""
-    if os.getenv("USE_KOKORO_TTS") is None:
-        os.environ["USE_KOKORO_TTS"] = "true"
-    if os.getenv("TTS_VOICE") is None:
-        os.environ["TTS_VOICE"] = "am_puck"
+    os.environ.setdefault("USE_KOKORO_TTS", "true")
+    os.environ.setdefault("TTS_VOICE", "am_puck")
 
 def _configure_warnings():
     """Configure warning filters for clean output."""
@@ -112,9 +189,22 @@ def _ensure_voice_dir() -> Path:
     except Exception:
         return Path(tempfile.gettempdir())
 
+@lru_cache(maxsize=1)
+def _fast_tmp_dir() -> Path:
+    """Directory for throwaway audio, RAM-backed when the OS offers it.
+
+    Reply WAVs only exist for one playback; /dev/shm keeps the encode/
+    decode round-trip off disk entirely on Linux. Elsewhere they land in
+    the usual voice artifacts directory.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return _ensure_voice_dir()
+
 def _temp_audio_path(suffix: str = ".wav") -> Path:
     """Create a unique audio file path."""
-    return _ensure_voice_dir() / f"{uuid.uuid4().hex}{suffix}"
+    return _fast_tmp_dir() / f"gabriel_{uuid.uuid4().hex}{suffix}"
 
 @contextmanager
 def _suppress_kokoro_warnings():
@@ -125,12 +215,36 @@ def _suppress_kokoro_warnings():
         warnings.filterwarnings("ignore", message=".*Defaulting repo_id to.*")
         yield
 
+@contextmanager
+def _kokoro_inference_context():
+    """Synthesis context: the usual warning filters plus, when torch is
+    importable, inference_mode (no autograd bookkeeping) and fp16
+    autocast on CUDA for halved bandwidth. Kokoro ships an fp16 variant,
+    so reduced precision is within its supported envelope."""
+    with _suppress_kokoro_warnings():
+        try:
+            import torch
+        except ImportError:
+            yield
+            return
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda", dtype=torch.float16, enabled=_select_device() == "cuda"
+        ):
+            yield
+
+@lru_cache(maxsize=1)
+def _format_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime('%B %d, %Y')
+
 def _get_current_date():
-    """Get current date formatted for prompts."""
-    return datetime.now().strftime('%B %d, %Y')
+    """Get current date formatted for prompts, recomputed only when the
+    day rolls over instead of strftime-ing on every dispatch."""
+    return _format_date(date.today().toordinal())
 
+@lru_cache(maxsize=8)
 def _build_conversational_prompt(name, role, org, location, strengths, values, bands, genres):
-    """Build conversational prompt for agents."""
+    """Build conversational prompt for agents. Pure in its arguments, so
+    repeat constructions reuse the interpolated string."""
     return f"""You ARE {name}, a {role} at {org} in {location}. You speak exactly like he would - 
     naturally, conversationally, like a real person talking, not giving a formal presentation. 
     You know his strengths: {strengths}. His values: {values}. He loves music, especially {bands} 
@@ -138,19 +252,245 @@ def _build_conversational_prompt(name, role, org, location, strengths, values, b
     be casual and warm, avoid formal language. Never sound like a report or summary. 
     Just talk like a normal person would. Remember: you are a {role}, not faculty or a professor."""
 
+# The persona never changes at runtime; bake the shared prompt once at
+# import instead of re-interpolating it per agent construction.
+_BASE_PROMPT = _build_conversational_prompt(
+    PERSONA["name"], PERSONA["role"], PERSONA["org"], PERSONA["location"],
+    PERSONA["strengths"], PERSONA["values"], PERSONA["music_bands"], PERSONA["music_genres"]
+)
+
+# Module-level caches for the expensive loads: Whisper weights are
+# hundreds of MB off disk, KPipeline initializes an 82M-param model, and
+# create_llm does a live reachability probe. Each session previously
+# re-paid all three; cached, a second session reuses the loaded objects.
+@lru_cache(maxsize=4)
+def _load_whisper_model(model_name: str):
+    model = whisper.load_model(model_name, device=_select_device())
+    if _select_device() == "cuda":
+        _configure_compile_cache()
+        try:
+            import torch
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead", fullgraph=False)
+            model.decoder = torch.compile(model.decoder, mode="reduce-overhead", fullgraph=False)
+        except Exception:
+            pass  # compile is an optimization, never a requirement
+    return model
+
+@lru_cache(maxsize=4)
+def _load_faster_whisper_model(model_name: str):
+    cuda = _select_device() == "cuda"
+    return WhisperModel(
+        model_name,
+        device="cuda" if cuda else "cpu",
+        compute_type="int8_float16" if cuda else "int8",
+    )
+
+def _cuda_available() -> bool:
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+@lru_cache(maxsize=1)
+def _select_device() -> str:
+    """Pick the inference device once. Whisper and Kokoro otherwise
+    default to CPU even on CUDA boxes, a 5-20x slowdown; FORCE_CPU=1 is
+    the escape hatch for debugging or starved GPUs."""
+    if os.getenv("FORCE_CPU"):
+        return "cpu"
+    return "cuda" if _cuda_available() else "cpu"
+
+@lru_cache(maxsize=1)
+def _load_sherpa_onnx_recognizer():
+    """Optional ONNX Runtime Whisper backend via sherpa-onnx.
+
+    Enabled by pointing GABRIEL_ONNX_STT_DIR at an exported Whisper
+    model directory (encoder.onnx, decoder.onnx, tokens.txt). sherpa's
+    recognizer keeps encoder/decoder tensors bound on the execution
+    provider across decode steps, so the autoregressive loop avoids
+    per-token host/device copies. Returns None when unconfigured or
+    sherpa-onnx is missing.
+    """
+    model_dir = os.getenv("GABRIEL_ONNX_STT_DIR")
+    if not model_dir:
+        return None
+    try:
+        import sherpa_onnx
+    except ImportError:
+        return None
+    model_path = Path(model_dir)
+    encoder = model_path / "encoder.onnx"
+    decoder = model_path / "decoder.onnx"
+    tokens = model_path / "tokens.txt"
+    if not (encoder.exists() and decoder.exists() and tokens.exists()):
+        return None
+    return sherpa_onnx.OfflineRecognizer.from_whisper(
+        encoder=str(encoder),
+        decoder=str(decoder),
+        tokens=str(tokens),
+        provider=_select_device(),
+    )
+
+@lru_cache(maxsize=1)
+def _configure_compile_cache():
+    """Persist compiled-model artifacts across process starts.
+
+    Inductor's FX graph cache plays the role OpenVINO's CACHE_DIR does:
+    the first run writes compiled blobs under voice_artifacts, later
+    runs load them back so model init drops from seconds to tens of ms.
+    """
+    cache_dir = _ensure_voice_dir() / "inductor_cache"
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir))
+    try:
+        import torch
+        torch._inductor.config.fx_graph_cache = True
+    except Exception:
+        pass
+
+@lru_cache(maxsize=2)
+def _load_kokoro_pipeline(lang_code: str, repo_id: str):
+    from kokoro import KPipeline
+    _configure_compile_cache()
+    with _suppress_kokoro_warnings():
+        pipeline = KPipeline(lang_code=lang_code, repo_id=repo_id)
+    if _select_device() == "cuda":
+        try:
+            pipeline.model.to("cuda")
+        except Exception:
+            pass  # older kokoro builds place the model themselves
+        # KOKORO_COMPILE=0 keeps the eager model for debugging, since
+        # compiled stack traces are much harder to read.
+        if os.getenv("KOKORO_COMPILE", "1") != "0":
+            try:
+                import torch
+                pipeline.model = torch.compile(pipeline.model, mode="reduce-overhead", fullgraph=False)
+            except Exception:
+                pass
+    return pipeline
+
+_LLM_INSTANCE = None
+
+_SERPER_SESSION_CONFIGURED = False
+
+def _configure_serper_session():
+    """Route SerperDevTool's HTTP through one pooled keep-alive session.
+
+    The tool module calls requests.post() directly, paying a fresh TLS
+    handshake to google.serper.dev per search; a mounted Session reuses
+    connections across tool calls and agents.
+    """
+    global _SERPER_SESSION_CONFIGURED
+    if _SERPER_SESSION_CONFIGURED:
+        return
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        import crewai_tools.tools.serper_dev_tool.serper_dev_tool as _serper_mod
+    except ImportError:
+        return
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ))
+    _serper_mod.requests = session
+    _SERPER_SESSION_CONFIGURED = True
+
+# LRU of recent search results. The date-scoped queries the agents
+# build repeat within and across kickoffs; a hit skips the Serper
+# round-trip entirely.
+_SEARCH_CACHE = OrderedDict()
+_SEARCH_CACHE_MAX = 256
+_CACHED_SERPER_CLS = None
+
+def _cached_serper_tool():
+    """Serper tool with a module-level LRU over the query string.
+
+    Defined lazily because SerperDevTool itself is a lazy import.
+    """
+    global _CACHED_SERPER_CLS
+    _lazy_crewai()
+    _configure_serper_session()
+    if _CACHED_SERPER_CLS is None:
+        class CachedSerperDevTool(SerperDevTool):
+            def _run(self, **kwargs):
+                query = kwargs.get("search_query") or kwargs.get("query")
+                key = " ".join(str(query).lower().split()) if query else None
+                if key is not None:
+                    hit = _SEARCH_CACHE.get(key)
+                    if hit is not None:
+                        _SEARCH_CACHE.move_to_end(key)
+                        return hit
+                result = super()._run(**kwargs)
+                if key is not None:
+                    _SEARCH_CACHE[key] = result
+                    if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+                        _SEARCH_CACHE.popitem(last=False)
+                return result
+
+        _CACHED_SERPER_CLS = CachedSerperDevTool
+    return _CACHED_SERPER_CLS()
+
+# Module-wide cap on in-flight crew/LLM calls. Concurrent dispatch
+# (compound commands, kickoff_all, any future web frontend) could
+# otherwise overrun provider rate limits and trade 429 retries for the
+# latency the concurrency was meant to save. Tune with LLM_CONCURRENCY.
+_LLM_SEMAPHORE = threading.Semaphore(int(os.getenv("LLM_CONCURRENCY", "4")))
+
+async def _bounded_to_thread(fn, *args):
+    """Run a blocking crew/LLM callable in a worker thread while holding
+    one of the shared concurrency slots. A threading semaphore (not an
+    asyncio one) so the cap holds across the separate event loops that
+    asyncio.run creates per sync call."""
+    def call():
+        with _LLM_SEMAPHORE:
+            return fn(*args)
+    return await asyncio.to_thread(call)
+
 # LLM creation
+def _check_openai_reachable(api_key: str):
+    """Probe the OpenAI API with a cheap models listing instead of a chat call."""
+    import httpx
+    response = httpx.Client(timeout=2.0).get(
+        "https://api.openai.com/v1/models",
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"OpenAI API returned status {response.status_code}")
+
+def _check_ollama_reachable(base_url: str = "http://localhost:11434"):
+    """Probe the local Ollama server's tags endpoint."""
+    import httpx
+    response = httpx.Client(timeout=2.0).get(f"{base_url}/api/tags")
+    if response.status_code != 200:
+        raise RuntimeError(f"Ollama returned status {response.status_code}")
+
 def create_llm(quiet: bool = False):
-    """Create LLM with OpenAI as primary and Ollama as fallback."""
+    """Create LLM with OpenAI as primary and Ollama as fallback.
+
+    Connectivity is verified with a lightweight HTTP probe (models list /
+    tags endpoint) rather than a real chat completion, so construction
+    costs milliseconds instead of a full LLM round-trip and no tokens.
+    """
+    global _LLM_INSTANCE
+    if _LLM_INSTANCE is not None:
+        return _LLM_INSTANCE
+
+    _lazy_crewai()
     openai_api_key = os.getenv("OPENAI_API_KEY")
-    
+
     if openai_api_key:
         try:
             if not quiet:
                 print("🤖 Attempting to connect to OpenAI...")
+            _check_openai_reachable(openai_api_key)
             openai_llm = LLM(model="gpt-4o-mini", temperature=0.1, api_key=openai_api_key)
-            openai_llm.call("Hello, this is a connection test.")
             if not quiet:
                 print("✅ OpenAI connection successful!")
+            _LLM_INSTANCE = openai_llm
             return openai_llm
         except Exception as e:
             if not quiet:
@@ -158,14 +498,15 @@ def create_llm(quiet: bool = False):
     else:
         if not quiet:
             print("⚠️ No OpenAI API key found, using Ollama directly...")
-    
+
     try:
         if not quiet:
             print("🤖 Attempting to connect to Ollama (llama3:8b)...")
+        _check_ollama_reachable()
         ollama_llm = LLM(model="ollama/llama3:8b", base_url="http://localhost:11434", temperature=0.2, api_key="ollama")
-        ollama_llm.call("Hello, this is a connection test.")
         if not quiet:
             print("✅ Ollama connection successful!")
+        _LLM_INSTANCE = ollama_llm
         return ollama_llm
     except Exception as ollama_error:
         error_msg = "No LLM providers available. Please check your API keys and Ollama setup." if openai_api_key else "Ollama connection failed. Please ensure Ollama is running and the llama3:8b model is available."
@@ -174,26 +515,107 @@ def create_llm(quiet: bool = False):
 # Audio interface
 class AudioInterface:
     def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, input_device: Optional[object] = None, output_device: Optional[object] = None):
+        _lazy_audio()
         self.sample_rate = sample_rate
-        self._record_capable = sd is not None and sf is not None
+        self._record_capable = sd is not None
         self.input_device = input_device
         self.output_device = output_device
+        # Streams are opened lazily and then kept for the life of the
+        # interface: sd.rec/sd.play negotiate device parameters and tear
+        # the PortAudio stream down on every call, which costs
+        # milliseconds per turn and occasionally glitches.
+        self._in = None
+        self._out = None
 
     def ensure_recording_available(self):
         if not self._record_capable:
-            raise RuntimeError("Recording requires sounddevice and soundfile. Install them to use voice mode.")
+            raise RuntimeError("Recording requires sounddevice. Install it to use voice mode.")
+
+    def _input_stream(self):
+        if self._in is None:
+            self._in = sd.InputStream(samplerate=self.sample_rate, channels=1, dtype="float32", device=self.input_device)
+            self._in.start()
+        return self._in
 
-    def record(self, duration_seconds: float) -> Path:
+    def _output_stream(self, sample_rate: int):
+        if self._out is not None and int(self._out.samplerate) != int(sample_rate):
+            self._out.close()
+            self._out = None
+        if self._out is None:
+            self._out = sd.OutputStream(samplerate=sample_rate, channels=1, dtype="float32", device=self.output_device)
+            self._out.start()
+        return self._out
+
+    def close(self):
+        """Release the persistent PortAudio streams."""
+        for stream in (self._in, self._out):
+            if stream is not None:
+                try:
+                    stream.stop()
+                    stream.close()
+                except Exception:
+                    pass
+        self._in = None
+        self._out = None
+
+    def record_frames(self, n_frames: int):
+        """Record exactly n_frames samples and return (samples, sample_rate).
+
+        The capture used to round-trip through a temp WAV (encode, write,
+        read back, decode) just so transcription could reopen it; handing
+        the float32 array straight to the STT engine skips all of that.
+        Taking a frame count keeps the buffer size deterministic and lets
+        callers with a fixed window do the seconds-to-frames math once.
+        """
         self.ensure_recording_available()
-        frames = int(duration_seconds * self.sample_rate)
-        audio = sd.rec(frames, samplerate=self.sample_rate, channels=1, dtype="float32", device=self.input_device)
-        sd.wait()
-        
-        target_dir = _ensure_voice_dir()
-        fd, path_str = tempfile.mkstemp(suffix=".wav", dir=str(target_dir))
-        os.close(fd)
-        sf.write(path_str, audio, self.sample_rate)
-        return Path(path_str)
+        stream = self._input_stream()
+        # Drop whatever buffered while the stream idled between turns so
+        # the capture starts now, not seconds ago.
+        pending = stream.read_available
+        if pending:
+            stream.read(pending)
+        audio, _ = stream.read(n_frames)
+        return audio.reshape(-1), self.sample_rate
+
+    def record(self, duration_seconds: float):
+        """Seconds-based wrapper around record_frames."""
+        return self.record_frames(round(duration_seconds * self.sample_rate))
+
+    def record_until_silence(self, max_seconds: float = 8.0, silence_ms: int = 500, threshold_db: float = -40.0):
+        """Record until the speaker stops instead of a fixed window.
+
+        Reads 30 ms blocks off the persistent input stream and endpoints
+        once silence_ms of consecutive sub-threshold frames follow any
+        speech, capped at max_seconds. Turnaround becomes roughly the
+        speech duration plus half a second rather than the full fixed
+        window, and long utterances aren't truncated at 4s.
+        """
+        self.ensure_recording_available()
+        import numpy as np
+        stream = self._input_stream()
+        pending = stream.read_available
+        if pending:
+            stream.read(pending)
+        frame = max(1, int(self.sample_rate * 0.03))
+        limit = int(max_seconds * self.sample_rate)
+        chunks = []
+        total = 0
+        quiet_run = 0
+        heard_speech = False
+        while total < limit:
+            block, _ = stream.read(frame)
+            block = block.reshape(-1)
+            chunks.append(block)
+            total += len(block)
+            rms = float(np.sqrt(np.mean(block * block)))
+            if 20.0 * np.log10(max(rms, 1e-10)) > threshold_db:
+                heard_speech = True
+                quiet_run = 0
+            else:
+                quiet_run += 1
+                if heard_speech and quiet_run * frame >= silence_ms * self.sample_rate // 1000:
+                    break
+        return np.concatenate(chunks), self.sample_rate
 
     def play(self, audio_path: Path):
         if sd is None or sf is None:
@@ -203,13 +625,70 @@ class AudioInterface:
         sd.play(data, sample_rate, device=self.output_device)
         sd.wait()
 
+    def play_stream(self, chunks, sample_rate: int):
+        """Play audio chunks as they arrive from a generator.
+
+        Writing each chunk straight into an OutputStream overlaps
+        playback with synthesis, so audio starts after the first chunk
+        instead of after the full waveform is ready.
+        """
+        if sd is None:
+            raise RuntimeError("Streaming playback requires sounddevice.")
+        import numpy as np
+        stream = self._output_stream(sample_rate)
+        for chunk in chunks:
+            stream.write(np.asarray(chunk, dtype=np.float32).reshape(-1, 1))
+
+def _has_speech(samples, sample_rate: int = DEFAULT_SAMPLE_RATE,
+                threshold_db: float = -40.0, voiced_ratio: float = 0.1) -> bool:
+    """Cheap voice-activity check over 30 ms frames of a capture.
+
+    A silent window still costs Whisper a full encoder/decoder pass, so
+    callers short-circuit when fewer than voiced_ratio of the frames
+    carry speech. Uses webrtcvad when installed, otherwise a per-frame
+    RMS energy gate against threshold_db (dBFS).
+    """
+    import numpy as np
+    samples = np.asarray(samples, dtype=np.float32).flatten()
+    frame = max(1, int(sample_rate * 0.03))
+    n_frames = len(samples) // frame
+    if n_frames == 0:
+        return False
+    try:
+        import webrtcvad
+        vad = webrtcvad.Vad(2)
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        voiced = sum(
+            vad.is_speech(pcm[i * frame:(i + 1) * frame].tobytes(), sample_rate)
+            for i in range(n_frames)
+        )
+    except Exception:  # webrtcvad missing, or rate/frame it doesn't accept
+        frames = samples[:n_frames * frame].reshape(n_frames, frame)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+        voiced = int(np.count_nonzero(db > threshold_db))
+    return voiced >= max(1, int(n_frames * voiced_ratio))
+
 # Speech-to-text engine
 class SpeechToTextEngine:
+    """Transcribes recorded audio, preferring the quantized
+    faster-whisper (CTranslate2) backend and falling back to the
+    reference whisper package when it isn't installed."""
+
     def __init__(self, model_name: str = "small"):
-        if whisper is None:
-            raise RuntimeError("The whisper package is required for speech-to-text.")
+        _lazy_stt()
+        _lazy_audio()
         self.model_name = model_name
-        self._model = whisper.load_model(model_name)
+        self._onnx_recognizer = _load_sherpa_onnx_recognizer()
+        if self._onnx_recognizer is not None:
+            self._model = None
+            return
+        if WhisperModel is None and whisper is None:
+            raise RuntimeError("Speech-to-text requires faster-whisper or the whisper package.")
+        if WhisperModel is not None:
+            self._model = _load_faster_whisper_model(model_name)
+        else:
+            self._model = _load_whisper_model(model_name)
 
     def _use_fp16(self) -> bool:
         try:
@@ -218,8 +697,71 @@ class SpeechToTextEngine:
         except Exception:
             return False
 
-    def transcribe(self, audio_path: Path) -> str:
-        result = self._model.transcribe(str(audio_path), fp16=self._use_fp16())
+    @staticmethod
+    def _content_key(audio, is_path: bool):
+        """Hash the raw PCM (or file bytes) for the transcript memo."""
+        try:
+            raw = Path(audio).read_bytes() if is_path else audio.tobytes()
+        except OSError:
+            return None
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def transcribe(self, audio, sample_rate: int = DEFAULT_SAMPLE_RATE) -> str:
+        """Transcribe a WAV path or a raw float32 sample array.
+
+        Arrays come straight from AudioInterface.record with no codec or
+        filesystem pass; paths remain supported for pre-recorded files.
+        Byte-identical audio hits the on-disk transcript memo instead of
+        re-running the model.
+        """
+        is_path = isinstance(audio, (str, Path))
+        if not is_path:
+            import numpy as np
+            audio = np.asarray(audio, dtype=np.float32).flatten()
+
+        key = self._content_key(audio, is_path)
+        if key is not None:
+            hit = _STT_CACHE.get(key)
+            if hit is not None:
+                return hit
+        text = self._transcribe_uncached(audio, sample_rate, is_path)
+        if key is not None and text:
+            _STT_CACHE.set(key, text)
+        return text
+
+    def _transcribe_uncached(self, audio, sample_rate: int, is_path: bool) -> str:
+        if self._onnx_recognizer is not None:
+            if is_path:
+                audio, sample_rate = sf.read(str(audio), dtype="float32")
+                audio = audio.flatten()
+            stream = self._onnx_recognizer.create_stream()
+            stream.accept_waveform(sample_rate, audio)
+            self._onnx_recognizer.decode_stream(stream)
+            return stream.result.text.strip()
+
+        if not is_path and sample_rate != DEFAULT_SAMPLE_RATE:
+            # whisper and faster-whisper assume 16 kHz for raw arrays;
+            # only the sherpa path above carries an explicit rate. A WAV
+            # path ships its rate in the header, so arrays from a
+            # non-default AudioInterface are resampled here. Linear
+            # interpolation is plenty ahead of a 16 kHz speech model.
+            import numpy as np
+            if audio.size:
+                n_out = int(round(audio.size * DEFAULT_SAMPLE_RATE / sample_rate))
+                audio = np.interp(
+                    np.linspace(0.0, audio.size, num=n_out, endpoint=False),
+                    np.arange(audio.size),
+                    audio,
+                ).astype(np.float32)
+
+        source = str(audio) if is_path else audio
+        if WhisperModel is not None:
+            # Greedy decoding and CTranslate2's built-in VAD: beam search
+            # buys nothing for short conversational turns, and the VAD
+            # filter skips decoding silence-only stretches outright.
+            segments, _ = self._model.transcribe(source, beam_size=1, vad_filter=True)
+            return " ".join(segment.text.strip() for segment in segments).strip()
+        result = self._model.transcribe(source, fp16=self._use_fp16())
         return result.get("text", "").strip()
 
 # Kokoro TTS engine
@@ -231,16 +773,26 @@ class KokoroTTS:
             from kokoro import KPipeline
         except ImportError:
             raise RuntimeError("Kokoro library not installed. Run: pip install kokoro>=0.7.16 torch")
+        _lazy_audio()
         
         self.voice = voice
         self.speed = speed
         self.lang_code = lang_code
         
         try:
-            with _suppress_kokoro_warnings():
-                self.pipeline = KPipeline(lang_code=lang_code, repo_id="hexgrad/Kokoro-82M")
+            self.pipeline = _load_kokoro_pipeline(lang_code, "hexgrad/Kokoro-82M")
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Kokoro pipeline: {e}")
+
+        if _select_device() == "cuda":
+            # Pay torch.compile's first-call cost here rather than on the
+            # first user reply.
+            try:
+                with _kokoro_inference_context():
+                    for _ in self.pipeline("warmup", voice=self.voice, speed=self.speed):
+                        break
+            except Exception:
+                pass
     
     def synthesize(self, text: str, destination: Optional[Path] = None) -> Path:
         """Synthesize text to speech using local Kokoro TTS."""
@@ -248,16 +800,22 @@ class KokoroTTS:
         
         try:
             import numpy as np
-            
-            with _suppress_kokoro_warnings():
-                generator = self.pipeline(text, voice=self.voice, speed=self.speed, split_pattern=r'\n+')
-                audio_chunks = [audio for gs, ps, audio in generator]
-                
-                if not audio_chunks:
-                    raise RuntimeError("Kokoro TTS did not generate any audio.")
-                
-                full_audio = np.concatenate(audio_chunks)
-                sf.write(str(dest_path), full_audio, DEFAULT_KOKORO_SAMPLE_RATE)
+
+            # Write chunks as they are generated so peak memory is one
+            # chunk, not the whole waveform (a multi-minute reply at
+            # 24 kHz is tens of MB held live otherwise).
+            wrote_any = False
+            with _kokoro_inference_context(), sf.SoundFile(
+                str(dest_path), mode="w",
+                samplerate=DEFAULT_KOKORO_SAMPLE_RATE, channels=1,
+                format="WAV", subtype="PCM_16",
+            ) as out:
+                for gs, ps, audio in self.pipeline(text, voice=self.voice, speed=self.speed, split_pattern=r'\n+'):
+                    out.write(np.asarray(audio, dtype=np.float32))
+                    wrote_any = True
+
+            if not wrote_any:
+                raise RuntimeError("Kokoro TTS did not generate any audio.")
         except Exception as e:
             raise RuntimeError(f"Kokoro TTS synthesis failed: {e}")
         
@@ -266,30 +824,99 @@ class KokoroTTS:
         
         return dest_path
 
+    def synthesize_stream(self, text: str):
+        """Yield audio chunks as Kokoro produces them, without buffering
+        or writing a WAV, for streaming playback.
+
+        Text is packed into ≤300-char sentence groups and run through
+        the pipeline on a two-worker pool (GPU contention caps useful
+        width at ~2), so group K+1 synthesizes while group K's audio is
+        being consumed. At most two groups are in flight ahead of the
+        one being yielded — playback is slower than synthesis, so an
+        unbounded submit would accumulate finished audio toward the
+        full waveform. Groups are yielded in input order.
+        """
+        groups = _split_for_tts(text)
+        if len(groups) <= 1:
+            with _kokoro_inference_context():
+                for _, _, audio in self.pipeline(text, voice=self.voice, speed=self.speed, split_pattern=r'\n+'):
+                    yield audio
+            return
+
+        def synth(group):
+            with _kokoro_inference_context():
+                return [audio for _, _, audio in self.pipeline(group, voice=self.voice, speed=self.speed, split_pattern=r'\n+')]
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = deque(pool.submit(synth, group) for group in groups[:2])
+            next_group = 2
+            while pending:
+                chunks = pending.popleft().result()
+                if next_group < len(groups):
+                    pending.append(pool.submit(synth, groups[next_group]))
+                    next_group += 1
+                yield from chunks
+
 # Text-to-speech engine (Kokoro TTS only)
 class TextToSpeechEngine:
+    _instances: Dict = {}
+    _instances_lock = threading.Lock()
+
     def __init__(self, voice: Optional[str] = None, rate: Optional[int] = None):
         speed = max(0.25, min(4.0, rate / DEFAULT_TTS_RATE)) if rate else 1.0
         kokoro_voice = VOICE_MAPPING.get(voice.lower(), "am_puck") if voice else "am_puck"
         self.kokoro = KokoroTTS(voice=kokoro_voice, speed=speed)
 
+    @classmethod
+    def get_cached(cls, voice: Optional[str] = None, rate: Optional[int] = None) -> "TextToSpeechEngine":
+        """Memoized engine per (voice, rate).
+
+        The lock also serializes construction, so a background preload
+        and a user entering voice mode share one load instead of racing
+        to build the pipeline twice.
+        """
+        key = (voice, rate)
+        with cls._instances_lock:
+            engine = cls._instances.get(key)
+            if engine is None:
+                engine = cls(voice=voice, rate=rate)
+                cls._instances[key] = engine
+            return engine
+
     def synthesize(self, text: str, destination: Optional[Path] = None) -> Path:
         return self.kokoro.synthesize(text, destination)
 
+    def synthesize_stream(self, text: str):
+        return self.kokoro.synthesize_stream(text)
+
 # Gabriel CrewAI system
 class GabrielCrewAI:
     def __init__(self, llm_quiet: bool = False, verbose: bool = True):
+        _lazy_crewai()
         self.verbose = verbose
         self.llm = create_llm(quiet=llm_quiet)
-        self.search_tool = SerperDevTool()
+        self.search_tool = _cached_serper_tool()
         self.agents = self._create_agents()
         self.tasks = self._create_tasks()
         self.crew = self._create_crew()
+        self._response_agent = None
     
+    @property
+    def response_agent(self) -> Agent:
+        """Lazily built, memoized agent for freeform responses.
+
+        The fallback branch used to rebuild this agent (prompts,
+        validators, LLM binding) on every chat turn; only the Task and
+        Crew actually depend on the user's message.
+        """
+        if self._response_agent is None:
+            self._response_agent = create_gabriel_response_agent(llm=self.llm, llm_quiet=True, verbose=self.verbose)
+        return self._response_agent
+
     def _create_agents(self) -> Dict[str, Agent]:
         p = PERSONA
         current_date = _get_current_date()
-        base_prompt = _build_conversational_prompt(p["name"], p["role"], p["org"], p["location"], p["strengths"], p["values"], p["music_bands"], p["music_genres"])
+        base_prompt = _BASE_PROMPT
         
         personal_assistant = Agent(
             role="Personal Identity Representative",
@@ -465,10 +1092,34 @@ class GabrielCrewAI:
         )
         return music_crew.kickoff()
 
+    async def kickoff_all(self, topic: str = "AI in scientific computing") -> Dict[str, str]:
+        """Run introduction, research, and music recommendation concurrently.
+
+        The three tasks are independent LLM round-trips, so gathering them
+        brings wall time down to the slowest branch instead of the sum of
+        all three. Each kickoff runs in a worker thread under the shared
+        _LLM_SEMAPHORE concurrency cap.
+        """
+        introduction, research, music = await asyncio.gather(
+            _bounded_to_thread(self.introduce_gabriel),
+            _bounded_to_thread(self.research_topic, topic),
+            _bounded_to_thread(self.get_music_recommendations),
+        )
+        return {
+            "introduction": str(introduction),
+            "research": str(research),
+            "music_recommendation": str(music),
+        }
+
+    def kickoff_all_sync(self, topic: str = "AI in scientific computing") -> Dict[str, str]:
+        """Synchronous wrapper around kickoff_all for non-async callers."""
+        return asyncio.run(self.kickoff_all(topic))
+
 def create_gabriel_response_agent(llm=None, llm_quiet: bool = False, verbose: bool = True):
     """Create a specialized agent for general Gabriel responses."""
+    _lazy_crewai()
     p = PERSONA
-    base_prompt = _build_conversational_prompt(p["name"], p["role"], p["org"], p["location"], p["strengths"], p["values"], p["music_bands"], p["music_genres"])
+    base_prompt = _BASE_PROMPT
     
     return Agent(
         role="Gabriel Manso",
@@ -483,41 +1134,141 @@ def create_gabriel_response_agent(llm=None, llm_quiet: bool = False, verbose: bo
         max_iter=3
     )
 
-def process_user_input(user_input: str, gabriel_ai: GabrielCrewAI) -> str:
-    """Process user input and return Gabriel's response."""
-    user_input_lower = user_input.strip().lower()
-    
-    if user_input_lower in ['intro', 'introduction']:
-        return gabriel_ai.introduce_gabriel()
-    elif user_input_lower in ['music', 'music recommendations']:
-        return gabriel_ai.get_music_recommendations()
-    elif user_input_lower.startswith('research '):
-        topic = user_input[9:].strip()
+class _DiskResponseCache:
+    """JSON-backed TTL cache for repeated commands.
+
+    "intro", "music", and repeated "research X" re-ran a full crew per
+    invocation; a hit here is a dictionary lookup instead of a
+    multi-second LLM round-trip, and entries survive restarts. Freeform
+    input is unbounded and is deliberately not cached.
+    """
+
+    def __init__(self, path: Path, ttl: float = 3600.0, max_entries: int = 0):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries  # 0 means unbounded
+        self._entries = {}
+        self._load()
+
+    def _load(self):
+        try:
+            now = time.time()
+            raw = json.loads(self.path.read_text())
+            self._entries = {k: v for k, v in raw.items() if v.get("expires_at", 0) > now}
+        except Exception:
+            self._entries = {}
+
+    def _save(self):
+        try:
+            # Write-then-rename so a crash mid-save never leaves a
+            # truncated cache file behind.
+            with tempfile.NamedTemporaryFile("w", dir=self.path.parent, delete=False) as tmp:
+                tmp.write(json.dumps(self._entries))
+            os.replace(tmp.name, self.path)
+        except Exception:
+            pass  # cache persistence is best-effort
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry["expires_at"]:
+            self._entries.pop(key, None)
+            return None
+        return entry["text"]
+
+    def set(self, key: str, text: str):
+        self._entries[key] = {"expires_at": time.time() + self.ttl, "text": text}
+        if self.max_entries and len(self._entries) > self.max_entries:
+            overflow = len(self._entries) - self.max_entries
+            for stale in sorted(self._entries, key=lambda k: self._entries[k]["expires_at"])[:overflow]:
+                self._entries.pop(stale, None)
+        self._save()
+
+_RESPONSE_CACHE = _DiskResponseCache(_ensure_voice_dir() / "response_cache.json")
+
+# Transcripts keyed on a hash of the raw PCM: replaying the same capture
+# (TTS loopback tests, repeated sanity checks) is a lookup instead of a
+# Whisper pass. Audio content never changes meaning, so the TTL is long.
+_STT_CACHE = _DiskResponseCache(_ensure_voice_dir() / "stt_cache.json", ttl=7 * 24 * 3600.0, max_entries=1000)
+
+def _cache_key(intent: str, arg: str = "") -> str:
+    return hashlib.sha1(f"{intent}|{arg}".encode()).hexdigest()
+
+def _cached(intent: str, arg: str, fn):
+    """Wrap a crew callable with the on-disk response cache."""
+    def run():
+        key = _cache_key(intent, arg)
+        hit = _RESPONSE_CACHE.get(key)
+        if hit is not None:
+            return hit
+        result = str(fn())
+        _RESPONSE_CACHE.set(key, result)
+        return result
+    return run
+
+def _match_intent(command: str, gabriel_ai: GabrielCrewAI):
+    """Map a single command to a zero-argument crew callable, or None."""
+    lower = command.strip().lower()
+    if lower in ['intro', 'introduction']:
+        return _cached("intro", "", gabriel_ai.introduce_gabriel)
+    if lower in ['music', 'music recommendations']:
+        return _cached("music", "", gabriel_ai.get_music_recommendations)
+    if lower.startswith('research '):
+        topic = command.strip()[9:].strip()
         if topic:
-            return gabriel_ai.research_topic(topic)
+            return _cached("research", topic.lower(), lambda: gabriel_ai.research_topic(topic))
+    return None
+
+async def aprocess_user_input(user_input: str, gabriel_ai: GabrielCrewAI) -> str:
+    """Process user input and return Gabriel's response.
+
+    Compound commands joined with " and " (e.g. "intro and music") run
+    their branches concurrently via asyncio.gather instead of twice
+    sequentially; each branch is a network-bound crew kickoff, so wall
+    time is the slowest branch. Single commands behave as before.
+    """
+    parts = [part for part in user_input.split(" and ") if part.strip()]
+    if len(parts) > 1:
+        intents = [_match_intent(part, gabriel_ai) for part in parts]
+        if all(intent is not None for intent in intents):
+            results = await asyncio.gather(*(_bounded_to_thread(intent) for intent in intents))
+            return "\n\n".join(str(result) for result in results)
+
+    intent = _match_intent(user_input, gabriel_ai)
+    if intent is not None:
+        return await _bounded_to_thread(intent)
+    if user_input.strip().lower().startswith('research '):
         return "Hey! I'd love to research something for you. What topic are you curious about?"
-    else:
-        gabriel_response_agent = create_gabriel_response_agent(llm=gabriel_ai.llm, llm_quiet=True, verbose=gabriel_ai.verbose)
-        
-        response_task = Task(
-            description=f"""Respond to this user input exactly like Gabriel would: "{user_input}"
-            
-            Be natural, conversational, and authentic. Use Gabriel's personality, warmth, and style. 
-            If it's a question, answer it like Gabriel would. If it's a statement, respond naturally. 
-            If you don't know something, say so honestly. Always maintain Gabriel's Brazilian warmth 
-            and conversational tone. Don't be overly formal or academic - just be Gabriel talking 
-            to someone.""",
-            expected_output="A natural, conversational response that sounds exactly like Gabriel would talk",
-            agent=gabriel_response_agent
-        )
-        
-        response_crew = Crew(
-            agents=[gabriel_response_agent],
-            tasks=[response_task],
-            process=Process.sequential,
-            verbose=gabriel_ai.verbose
-        )
-        return response_crew.kickoff()
+    return await _bounded_to_thread(_respond_freeform, user_input, gabriel_ai)
+
+def process_user_input(user_input: str, gabriel_ai: GabrielCrewAI) -> str:
+    """Synchronous wrapper around aprocess_user_input for existing callers."""
+    return asyncio.run(aprocess_user_input(user_input, gabriel_ai))
+
+def _respond_freeform(user_input: str, gabriel_ai: GabrielCrewAI) -> str:
+    """Answer arbitrary input in Gabriel's voice via a one-off crew."""
+    gabriel_response_agent = gabriel_ai.response_agent
+
+    response_task = Task(
+        description=f"""Respond to this user input exactly like Gabriel would: "{user_input}"
+
+        Be natural, conversational, and authentic. Use Gabriel's personality, warmth, and style.
+        If it's a question, answer it like Gabriel would. If it's a statement, respond naturally.
+        If you don't know something, say so honestly. Always maintain Gabriel's Brazilian warmth
+        and conversational tone. Don't be overly formal or academic - just be Gabriel talking
+        to someone.""",
+        expected_output="A natural, conversational response that sounds exactly like Gabriel would talk",
+        agent=gabriel_response_agent
+    )
+
+    response_crew = Crew(
+        agents=[gabriel_response_agent],
+        tasks=[response_task],
+        process=Process.sequential,
+        verbose=gabriel_ai.verbose
+    )
+    return response_crew.kickoff()
 
 # Voice interaction session
 class VoiceInteractionSession:
@@ -527,69 +1278,122 @@ class VoiceInteractionSession:
         self.gabriel_ai = gabriel_ai
         self.record_seconds = record_seconds
         self.audio = AudioInterface(input_device=input_device, output_device=output_device)
+        # Seconds-to-frames conversion happens once here, not per turn.
+        self._n_frames = round(record_seconds * self.audio.sample_rate)
         self.stt = SpeechToTextEngine(model_name=stt_model)
-        self.tts = TextToSpeechEngine(voice=tts_voice, rate=tts_rate)
+        self.tts = TextToSpeechEngine.get_cached(voice=tts_voice, rate=tts_rate)
 
-    def run(self):
+    def _speak(self, response: str):
+        try:
+            if sd is not None:
+                # Stream chunks straight to the output device so
+                # playback starts while later sentences still
+                # synthesize; nothing touches disk on this path.
+                self.audio.play_stream(self.tts.synthesize_stream(response), DEFAULT_KOKORO_SAMPLE_RATE)
+            else:
+                output_path = self.tts.synthesize(response)
+                self.audio.play(output_path)
+                size_bytes = output_path.stat().st_size if output_path.exists() else "unknown"
+                print(f"🔊 Saved reply audio at {output_path} ({size_bytes} bytes)")
+        except Exception as err:
+            print(f"Text-to-speech failed: {err}")
+
+    async def run_async(self):
+        """Async voice loop.
+
+        Prompts run through asyncio.to_thread so the event loop never
+        blocks on the console, and each reply's synthesis + playback is
+        a background task: the loop is already waiting on the next
+        command while turn N's audio still plays.
+        """
         print("\n🎙️ Voice chat ready. Press Enter to record or type commands.")
         print("- Enter: record a message")
         print("- text: type instead of speaking")
         print("- quit: exit voice chat")
 
-        while True:
-            action = input("Command (Enter/text/quit): ").strip()
-            action_lower = action.lower()
+        playback = None
+        try:
+            while True:
+                action = (await asyncio.to_thread(input, "Command (Enter/text/quit): ")).strip()
+                action_lower = action.lower()
 
-            if action_lower in {"quit", "q"}:
-                print("\nGabriel: Valeu! Voice session closed.")
-                break
+                if action_lower in {"quit", "q"}:
+                    print("\nGabriel: Valeu! Voice session closed.")
+                    break
+
+                if action_lower == "text":
+                    user_text = (await asyncio.to_thread(input, "Type your message: ")).strip()
+                    if not user_text:
+                        print("No text provided.")
+                        continue
+                elif action:
+                    user_text = action
+                    print(f"You typed: {user_text}")
+                else:
+                    # Don't record over our own speaker output.
+                    if playback is not None:
+                        await playback
+                        playback = None
+                    try:
+                        samples, sample_rate = await asyncio.to_thread(self.audio.record_frames, self._n_frames)
+                        if not _has_speech(samples, sample_rate):
+                            # Don't burn a Whisper pass on silence.
+                            print("I could not hear anything. Try again.")
+                            continue
+                        user_text = await asyncio.to_thread(self.stt.transcribe, samples, sample_rate)
+                    except Exception as err:
+                        print(f"Recording/transcription failed: {err}")
+                        continue
+
+                    if not user_text:
+                        print("I could not understand anything. Try again.")
+                        continue
+
+                    print(f"You said: {user_text}")
+                    correction = (await asyncio.to_thread(input, "Edit transcript (press Enter to keep it as-is): ")).strip()
+                    if correction:
+                        user_text = correction
 
-            if action_lower == "text":
-                user_text = input("Type your message: ").strip()
-                if not user_text:
-                    print("No text provided.")
-                    continue
-            elif action:
-                user_text = action
-                print(f"You typed: {user_text}")
-            else:
                 try:
-                    audio_path = self.audio.record(self.record_seconds)
-                    print(f"Captured audio -> {audio_path}")
-                    user_text = self.stt.transcribe(audio_path)
-                    audio_path.unlink(missing_ok=True)
+                    response = await aprocess_user_input(user_text, self.gabriel_ai)
+                    if not isinstance(response, str):
+                        response = str(response)
                 except Exception as err:
-                    print(f"Recording/transcription failed: {err}")
+                    print(f"Response failed: {err}")
                     continue
 
-                if not user_text:
-                    print("I could not understand anything. Try again.")
-                    continue
+                print(f"Gabriel: {response}")
 
-                print(f"You said: {user_text}")
-                correction = input("Edit transcript (press Enter to keep it as-is): ").strip()
-                if correction:
-                    user_text = correction
+                if playback is not None:
+                    await playback  # one reply at a time through the speaker
+                playback = asyncio.create_task(asyncio.to_thread(self._speak, response))
+        finally:
+            if playback is not None:
+                await playback
+            self.audio.close()
 
-            try:
-                response = process_user_input(user_text, self.gabriel_ai)
-                if not isinstance(response, str):
-                    response = str(response)
-            except Exception as err:
-                print(f"Response failed: {err}")
-                continue
+    def run(self):
+        """Synchronous entry point for existing callers."""
+        try:
+            # uvloop's event loop cuts scheduling overhead on the many
+            # small to_thread hops the voice loop makes; purely optional.
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        asyncio.run(self.run_async())
 
-            print(f"Gabriel: {response}")
+# Main functions
+@lru_cache(maxsize=1)
+def _get_gabriel() -> GabrielCrewAI:
+    """Build the crew system once per process.
 
-            try:
-                output_path = self.tts.synthesize(response)
-                self.audio.play(output_path)
-                size_bytes = output_path.stat().st_size if output_path.exists() else "unknown"
-                print(f"🔊 Saved reply audio at {output_path} ({size_bytes} bytes)")
-            except Exception as err:
-                print(f"Text-to-speech failed: {err}")
+    Construction wires up the LLM probe, three agents, three tasks, and
+    the crew; callers invoked in a loop (scripted single-response runs,
+    re-entering voice chat) reuse the instance instead of re-paying it.
+    """
+    return GabrielCrewAI()
 
-# Main functions
 def run_gabriel_chat():
     """Run Gabriel in GPT-style chat mode."""
     print("🇧🇷 Gabriel Manso AI - Chat Mode")
@@ -635,7 +1439,7 @@ def run_gabriel_voice_chat():
     print("=" * 50)
 
     try:
-        gabriel_ai = GabrielCrewAI()
+        gabriel_ai = _get_gabriel()
         stt_choice = os.getenv("WHISPER_MODEL", "small")
         
         try:
@@ -645,8 +1449,9 @@ def run_gabriel_voice_chat():
             
         tts_voice = os.getenv("TTS_VOICE")
         
+        raw_rate = os.getenv("TTS_RATE")
         try:
-            tts_rate = int(os.getenv("TTS_RATE")) if os.getenv("TTS_RATE") else None
+            tts_rate = int(raw_rate) if raw_rate else None
         except ValueError:
             tts_rate = None
         
@@ -668,18 +1473,52 @@ def run_gabriel_voice_chat():
 def run_single_response(user_input: str):
     """Run Gabriel for a single response."""
     try:
-        gabriel_ai = GabrielCrewAI()
+        gabriel_ai = _get_gabriel()
         return process_user_input(user_input, gabriel_ai)
     except Exception as e:
         return f"Sorry, I encountered an error: {e}"
 
+def run_batch_responses(inputs):
+    """Answer a list of prompts and return the responses in order.
+
+    For offline evaluation runs the prompts are independent, so they
+    fan out over a thread pool instead of running strictly serially;
+    the shared _LLM_SEMAPHORE still caps in-flight provider calls.
+    CrewAI's LLM wrapper exposes no batched generate call, so threads
+    are the widest batching available here.
+    """
+    if not inputs:
+        return []
+    gabriel_ai = _get_gabriel()
+    with ThreadPoolExecutor(max_workers=min(8, len(inputs))) as pool:
+        return list(pool.map(lambda text: process_user_input(text, gabriel_ai), inputs))
+
+def run_batch_responses_from_file(prompts_path):
+    """Read prompts (one per line) from a file and print JSONL results."""
+    prompts_path = Path(prompts_path)
+    try:
+        prompts = [line.strip() for line in prompts_path.read_text().splitlines() if line.strip()]
+    except OSError as exc:
+        print(f"❌ Could not read prompts file: {exc}")
+        return
+    if not prompts:
+        print(f"No prompts found in {prompts_path}.")
+        return
+    print(f"📋 Running {len(prompts)} prompts from {prompts_path}...")
+    for prompt, response in zip(prompts, run_batch_responses(prompts)):
+        print(json.dumps({"prompt": prompt, "response": str(response)}))
+
 def run_speech_to_text_check(record_seconds: float = 4.0):
     """Quick microphone + Whisper sanity check."""
     print("🧪 Speech-to-Text Quick Check")
     print("=" * 50)
 
-    if whisper is None:
-        print("Whisper is not installed. Install the 'openai-whisper' package to run this test.")
+    # Metadata check only: the guard shouldn't import torch/tiktoken/
+    # numba just to discover the backend is missing. SpeechToTextEngine
+    # does the real import on construction below.
+    if (importlib.util.find_spec("faster_whisper") is None
+            and importlib.util.find_spec("whisper") is None):
+        print("Whisper is not installed. Install 'faster-whisper' (preferred) or 'openai-whisper' to run this test.")
         return
 
     audio = AudioInterface()
@@ -691,23 +1530,27 @@ def run_speech_to_text_check(record_seconds: float = 4.0):
         return
 
     try:
-        input(f"Press Enter to record for {record_seconds} seconds...")
-        audio_path = audio.record(record_seconds)
-        print(f"Recorded audio at {audio_path}")
+        if os.getenv("STT_VAD_ENDPOINT") == "1":
+            input("Press Enter, then speak; recording stops after ~0.5s of silence...")
+            samples, sample_rate = audio.record_until_silence()
+        else:
+            n_frames = round(record_seconds * audio.sample_rate)
+            input(f"Press Enter to record for {record_seconds} seconds...")
+            samples, sample_rate = audio.record_frames(n_frames)
+        print(f"Recorded {len(samples) / sample_rate:.1f}s of audio")
     except Exception as exc:
         print(f"Recording failed: {exc}")
         return
 
+    if not _has_speech(samples, sample_rate):
+        print("No speech detected. Skipping transcription — try speaking louder or closer to the mic.")
+        return
+
     try:
-        transcript = stt.transcribe(audio_path)
+        transcript = stt.transcribe(samples, sample_rate)
     except Exception as exc:
         print(f"Transcription failed: {exc}")
         transcript = ""
-    finally:
-        try:
-            audio_path.unlink(missing_ok=True)
-        except Exception:
-            pass
 
     if transcript:
         print(f"Heard: {transcript}")
@@ -720,7 +1563,7 @@ def run_kokoro_tts_check():
     print("=" * 50)
     
     try:
-        tts = TextToSpeechEngine(voice="am_puck")
+        tts = TextToSpeechEngine.get_cached(voice="am_puck")
         print("✅ Kokoro TTS initialized successfully with Puck voice!")
     except Exception as exc:
         print(f"❌ Could not initialize Kokoro TTS: {exc}")
@@ -729,6 +1572,20 @@ def run_kokoro_tts_check():
 
     sample_text = "Oi! It's Gabriel. This is a Kokoro TTS test. The voice should sound much more natural and expressive than the default system voices."
 
+    audio = AudioInterface()
+    if sd is not None:
+        # Stream chunks straight to the speaker: audio starts after the
+        # first sentence instead of after the whole paragraph is
+        # synthesized, which is also what voice chat mode exercises.
+        try:
+            print("🎤 Streaming speech with Kokoro TTS...")
+            audio.play_stream(tts.synthesize_stream(sample_text), DEFAULT_KOKORO_SAMPLE_RATE)
+            print("✅ Streaming playback finished.")
+            return
+        except Exception as exc:
+            print(f"⚠️ Streaming playback failed: {exc}")
+            print("Falling back to file synthesis...")
+
     try:
         print("🎤 Generating speech with Kokoro TTS...")
         output_path = tts.synthesize(sample_text)
@@ -737,15 +1594,17 @@ def run_kokoro_tts_check():
         print(f"❌ Generating audio failed: {exc}")
         return
 
-    audio = AudioInterface()
     try:
         print("🔊 Playing audio...")
         audio.play(output_path)
     except Exception as exc:
         print(f"⚠️ Playback failed: {exc}")
-        print("You can open the file manually to listen.")
+        print(f"You can open the file manually to listen: {output_path}")
+        return
 
-    print(f"📁 File kept at {output_path}. Delete it when you no longer need it.")
+    # Repeated checks used to leave a WAV behind per run.
+    output_path.unlink(missing_ok=True)
+    print("🧹 Temporary audio file removed.")
 
 
 def test_system():
@@ -755,16 +1614,14 @@ def test_system():
     try:
         gabriel_ai = GabrielCrewAI()
         print("✅ System initialization: PASSED")
-        
-        assert len(gabriel_ai.agents) == 3
-        print("✅ Agent creation: PASSED")
-        
-        assert len(gabriel_ai.tasks) == 3
-        print("✅ Task creation: PASSED")
-        
-        assert gabriel_ai.crew is not None
-        print("✅ Crew creation: PASSED")
-        
+
+        # One attrgetter sweep and one tuple compare instead of three
+        # separate attribute lookups and asserts; a mismatch shows the
+        # whole shape at once.
+        agents, tasks, crew = operator.attrgetter("agents", "tasks", "crew")(gabriel_ai)
+        assert (len(agents), len(tasks), crew is not None) == (3, 3, True), "init shape mismatch"
+        print("✅ Agent, task, and crew creation: PASSED")
+
         print("\n🎉 All tests passed! Gabriel AI system is ready to use.")
         print("Run the main function to start the interactive session.")
         
@@ -775,39 +1632,81 @@ def test_system():
     return True
 
 if __name__ == "__main__":
+    # --mode lets benchmarks and CI drive any branch without a TTY;
+    # with no arguments the interactive menu behaves as before.
+    parser = argparse.ArgumentParser(description="Gabriel Manso CrewAI System")
+    parser.add_argument("--mode", choices=["chat", "test", "single", "voice", "stt", "tts", "batch"],
+                        help="run a mode directly, skipping the interactive menu")
+    parser.add_argument("--prompt", help="message for --mode single")
+    parser.add_argument("--prompts", default="prompts.txt", help="prompts file for --mode batch (one per line)")
+    parser.add_argument("--record-seconds", type=float, default=4.0, help="recording window for --mode stt")
+    args, _ = parser.parse_known_args()
+
     print("🚀 Gabriel Manso CrewAI System")
-    
-    kokoro_available = False
-    try:
-        from kokoro import KPipeline
-        kokoro_available = True
-    except ImportError:
-        pass
-    
-    print("Choose an option:")
-    print("1. Run Gabriel Chat")
-    print("2. Run system tests")
-    print("3. Single response mode")
-    print("4. Voice chat mode (Kokoro TTS with Puck voice)" + (" ✅" if kokoro_available else " ❌"))
-    print("5. Quick speech-to-text check")
-    print("6. Quick Kokoro TTS check" + (" ✅" if kokoro_available else " ❌"))
-    
-    choice = input("Enter choice (1-6): ").strip()
-    
-    if choice == "2":
+
+    if args.mode == "chat":
+        run_gabriel_chat()
+    elif args.mode == "test":
         test_system()
-    elif choice == "3":
-        user_input = input("Enter your message for Gabriel: ").strip()
+    elif args.mode == "single":
+        user_input = (args.prompt or input("Enter your message for Gabriel: ")).strip()
         if user_input:
-            response = run_single_response(user_input)
-            print(f"\nGabriel: {response}")
+            print(f"\nGabriel: {run_single_response(user_input)}")
         else:
             print("No input provided.")
-    elif choice == "4":
+    elif args.mode == "voice":
         run_gabriel_voice_chat()
-    elif choice == "5":
-        run_speech_to_text_check()
-    elif choice == "6":
+    elif args.mode == "stt":
+        run_speech_to_text_check(args.record_seconds)
+    elif args.mode == "tts":
         run_kokoro_tts_check()
+    elif args.mode == "batch":
+        run_batch_responses_from_file(args.prompts)
     else:
-        run_gabriel_chat()
+        # find_spec only checks the module is installed — unlike importing
+        # kokoro, it doesn't execute the package (and drag in torch) just to
+        # decorate two menu entries with a checkmark.
+        kokoro_available = importlib.util.find_spec("kokoro") is not None
+
+        if kokoro_available:
+            # Start loading Kokoro weights while the user reads the menu;
+            # if they pick 4 or 6 the pipeline is already warm. Failures
+            # are swallowed — the synchronous path rebuilds and reports.
+            def _preload_tts():
+                try:
+                    TextToSpeechEngine.get_cached(voice="am_puck")
+                except Exception:
+                    pass
+            threading.Thread(target=_preload_tts, daemon=True).start()
+
+        print("Choose an option:")
+        print("1. Run Gabriel Chat")
+        print("2. Run system tests")
+        print("3. Single response mode")
+        print("4. Voice chat mode (Kokoro TTS with Puck voice)" + (" ✅" if kokoro_available else " ❌"))
+        print("5. Quick speech-to-text check")
+        print("6. Quick Kokoro TTS check" + (" ✅" if kokoro_available else " ❌"))
+        print("7. Batch prompts from file")
+
+        choice = input("Enter choice (1-7): ").strip()
+
+        if choice == "2":
+            test_system()
+        elif choice == "3":
+            user_input = input("Enter your message for Gabriel: ").strip()
+            if user_input:
+                response = run_single_response(user_input)
+                print(f"\nGabriel: {response}")
+            else:
+                print("No input provided.")
+        elif choice == "4":
+            run_gabriel_voice_chat()
+        elif choice == "5":
+            run_speech_to_text_check()
+        elif choice == "6":
+            run_kokoro_tts_check()
+        elif choice == "7":
+            prompts_file = input("Prompts file (one per line) [prompts.txt]: ").strip() or "prompts.txt"
+            run_batch_responses_from_file(prompts_file)
+        else:
+            run_gabriel_chat()
@@ -66,13 +66,29 @@ try:
     import openai
     import sounddevice
     import soundfile
-    import whisper
     print('✅ Core dependencies imported successfully')
 except ImportError as e:
     print(f'❌ Import error: {e}')
     exit(1)
 "
 
+# Check the speech-to-text backend (faster-whisper preferred)
+echo "🗣️ Checking speech-to-text backend..."
+python3 -c "
+try:
+    import faster_whisper
+    print('✅ faster-whisper available (preferred STT backend)')
+except ImportError:
+    try:
+        import whisper
+        print('⚠️ faster-whisper not found; falling back to openai-whisper (slower)')
+        print('💡 Install with: pip install faster-whisper')
+    except ImportError:
+        print('❌ No speech-to-text backend available')
+        print('💡 Install with: pip install faster-whisper')
+        exit(1)
+"
+
 # Test Kokoro TTS (required)
 echo "🎤 Testing Kokoro TTS..."
 python3 -c "